@@ -1,5 +1,8 @@
 import os
-from copy import deepcopy
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
 from typing import Any
 from pathlib import Path
 from dotenv import load_dotenv
@@ -7,15 +10,54 @@ from loguru import logger
 
 from app.utils.logger import config as configure_logger
 
+
+@cache
+def load_dotenv_once() -> None:
+    """Load ``.env`` into ``os.environ`` at most once per process.
+
+    The guard is process-local (the call is memoized), so later callers such
+    as the bootstrap step skip re-parsing the file, while reloader workers
+    and other child processes still read a fresh ``.env`` on start-up. Call
+    this instead of ``dotenv.load_dotenv`` anywhere else in the application.
+    """
+    load_dotenv(override=False)
+
+
 # Load .env as early as possible so all downstream imports see the intended env
-load_dotenv()
+load_dotenv_once()
 
 # Configure logger after env is loaded (LOG_LEVEL honored)
 configure_logger()
 
-logger.debug("Checking if running in Docker...")
-IN_DOCKER = Path("/.dockerenv").exists()
-logger.debug(f"IN_DOCKER={IN_DOCKER}")
+# Snapshot the environment once (after .env has been applied) and parse every
+# setting from it. This avoids one os.getenv round-trip per setting and keeps
+# the parsed values consistent even if the environment changes mid-import.
+_ENV: dict[str, str] = os.environ.copy()
+
+
+def _get(key: str, default: str = "", *, lower: bool = False) -> str:
+    """Return the stripped value of *key* from the environment snapshot."""
+    value = _ENV.get(key, default).strip()
+    return value.lower() if lower else value
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _as_bool(val: str | None, default: bool) -> bool:
+    if val is None:
+        return default
+    return val.strip().lower() in _TRUTHY
+
+
+# ANIBRIDGE_IN_DOCKER lets orchestrators state the runtime explicitly, which
+# skips probing /.dockerenv (not present on every container runtime anyway).
+_in_docker_override = _ENV.get("ANIBRIDGE_IN_DOCKER", "").strip()
+if _in_docker_override:
+    IN_DOCKER = _as_bool(_in_docker_override, False)
+else:
+    logger.debug("Checking if running in Docker...")
+    IN_DOCKER = Path("/.dockerenv").exists()
 
 
 def _discover_repo_root() -> Path:
@@ -30,25 +72,13 @@ def _discover_repo_root() -> Path:
 
     this_file = Path(__file__).resolve()
     for candidate in this_file.parents:
-        if (candidate / ".github").exists() and (
-            candidate / "apps" / "api" / "pyproject.toml"
+        if (candidate / ".github").exists() and candidate.joinpath(
+            "apps", "api", "pyproject.toml"
         ).exists():
             return candidate
     return Path.cwd()
 
 
-# --- Networking / transport policy ---
-# Legacy in-app outbound proxy support has been removed on purpose.
-# AniBridge now expects traffic shaping/anonymization to happen externally
-# (for example via host VPN, container VPN sidecar, or network namespace).
-# STRM proxying is a separate feature and remains supported.
-def _as_bool(val: str | None, default: bool) -> bool:
-    if val is None:
-        return default
-    v = val.strip().lower()
-    return v in ("1", "true", "yes", "on")
-
-
 def _as_non_negative_int(val: str | None, default: int) -> int:
     """Parse *val* as a non-negative integer, returning *default* on failure."""
     if val is None:
@@ -66,38 +96,104 @@ def _as_non_negative_int(val: str | None, default: int) -> int:
     return parsed
 
 
+def _as_int(key: str, default: int) -> int:
+    """Read ``key`` as an integer, returning ``default`` if unset or invalid."""
+    val = _ENV.get(key)
+    if val is None or not val.strip():
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        logger.warning("Invalid {}={!r}; defaulting to {}.", key, val, default)
+        return default
+
+
+def _as_positive_int(key: str, default: int) -> int:
+    """Read ``key`` as a positive integer, returning ``default`` otherwise."""
+    parsed = _as_int(key, default)
+    if parsed <= 0:
+        logger.warning(
+            "{} must be positive (got {}); defaulting to {}.", key, parsed, default
+        )
+        return default
+    return parsed
+
+
+def _as_float(key: str, default: float) -> float:
+    """Read ``key`` as a float, returning ``default`` if unset or invalid."""
+    val = _ENV.get(key)
+    if val is None or not val.strip():
+        return default
+    try:
+        return float(val)
+    except ValueError:
+        logger.warning("Invalid {}={!r}; defaulting to {}.", key, val, default)
+        return default
+
+
+def _parse_csv_unique(raw: str) -> list[str]:
+    """Split a comma-separated value into stripped, de-duplicated entries.
+
+    Entries are interned because they end up as lookup keys (site names,
+    host names) that are compared against literals on every request.
+    """
+    seen: dict[str, None] = {}
+    for part in raw.split(","):
+        part = part.strip()
+        if part:
+            seen[sys.intern(part)] = None
+    return list(seen)
+
+
+def _as_enum(key: str, default: str, allowed: frozenset[str]) -> str:
+    """Read ``key`` as a lowercase choice, falling back to ``default`` if invalid."""
+    value = _get(key, default, lower=True)
+    if value in allowed:
+        return value
+    logger.warning("Invalid {}={!r}; defaulting to {!r}.", key, value, default)
+    return default
+
+
+# --- Networking / transport policy ---
+# Legacy in-app outbound proxy support has been removed on purpose.
+# AniBridge now expects traffic shaping/anonymization to happen externally
+# (for example via host VPN, container VPN sidecar, or network namespace).
+# STRM proxying is a separate feature and remains supported.
 # Always-on public IP monitor.
-PUBLIC_IP_CHECK_ENABLED = _as_bool(os.getenv("PUBLIC_IP_CHECK_ENABLED", None), False)
-PUBLIC_IP_CHECK_INTERVAL_MIN = int(os.getenv("PUBLIC_IP_CHECK_INTERVAL_MIN", "30") or 0)
+PUBLIC_IP_CHECK_ENABLED = _as_bool(_ENV.get("PUBLIC_IP_CHECK_ENABLED"), False)
+PUBLIC_IP_CHECK_INTERVAL_MIN = int(_ENV.get("PUBLIC_IP_CHECK_INTERVAL_MIN", "30") or 0)
 
 # Hard deprecation warnings for removed in-app proxy settings.
 # We keep explicit logging so operators immediately know why these values are
 # ignored after upgrading.
-_REMOVED_PROXY_ENV_VARS = (
-    "PROXY_ENABLED",
-    "PROXY_URL",
-    "HTTP_PROXY_URL",
-    "HTTPS_PROXY_URL",
-    "ALL_PROXY_URL",
-    "PROXY_HOST",
-    "PROXY_PORT",
-    "PROXY_SCHEME",
-    "PROXY_USERNAME",
-    "PROXY_PASSWORD",
-    "NO_PROXY",
-    "PROXY_FORCE_REMOTE_DNS",
-    "PROXY_DISABLE_CERT_VERIFY",
-    "PROXY_APPLY_ENV",
-    "PROXY_IP_CHECK_INTERVAL_MIN",
-    "PROXY_SCOPE",
-)
-for _env_name in _REMOVED_PROXY_ENV_VARS:
-    if _env_name in os.environ:
-        logger.warning(
-            "{} is set but ignored: outbound in-app proxy support was removed. "
-            "Use an external VPN tunnel or VPN sidecar instead.",
-            _env_name,
-        )
+_REMOVED_PROXY_ENV_VARS = frozenset(
+    {
+        "PROXY_ENABLED",
+        "PROXY_URL",
+        "HTTP_PROXY_URL",
+        "HTTPS_PROXY_URL",
+        "ALL_PROXY_URL",
+        "PROXY_HOST",
+        "PROXY_PORT",
+        "PROXY_SCHEME",
+        "PROXY_USERNAME",
+        "PROXY_PASSWORD",
+        "NO_PROXY",
+        "PROXY_FORCE_REMOTE_DNS",
+        "PROXY_DISABLE_CERT_VERIFY",
+        "PROXY_APPLY_ENV",
+        "PROXY_IP_CHECK_INTERVAL_MIN",
+        "PROXY_SCOPE",
+    }
+)
+# The set intersection does the membership checks in one C-level pass; sorted
+# so the warnings come out in a stable order.
+for _env_name in sorted(_ENV.keys() & _REMOVED_PROXY_ENV_VARS):
+    logger.warning(
+        "{} is set but ignored: outbound in-app proxy support was removed. "
+        "Use an external VPN tunnel or VPN sidecar instead.",
+        _env_name,
+    )
 
 
 def _str_to_path(val: str | os.PathLike[str] | None) -> Path | None:
@@ -105,205 +201,274 @@ def _str_to_path(val: str | os.PathLike[str] | None) -> Path | None:
         return None
     try:
         return Path(val).expanduser()
-    except Exception:
+    # expanduser() raises RuntimeError when the home directory is unknown.
+    except TypeError, ValueError, RuntimeError:
         return None
 
 
-def _ensure_dir(candidates: list[Path], label: str) -> Path:
+def _ensure_dir(candidates: Iterable[Path], label: str) -> Path:
     """Return first usable path from candidates, creating it if needed.
 
-    Logs fallbacks and exits with a clear error if none are writable.
+    Candidates are consumed lazily, so later fallbacks are never built once an
+    earlier one succeeds. Logs fallbacks and exits with a clear error if none
+    are writable.
     """
+    tried: list[Path] = []
     for p in candidates:
+        tried.append(p)
         try:
-            p.mkdir(parents=True, exist_ok=True)
+            # Existing directories (the common case after the first start)
+            # only cost a stat plus an access check instead of mkdir's
+            # per-component walk. Read-only mounts fall through to the next
+            # candidate instead of failing later on the first write.
+            if p.is_dir():
+                if not os.access(p, os.W_OK):
+                    logger.warning("{} candidate {} is not writable", label, p)
+                    continue
+            else:
+                p.mkdir(parents=True, exist_ok=True)
             resolved = p.resolve()
-            logger.info(f"{label} using: {resolved}")
+            logger.info("{} using: {}", label, resolved)
             return resolved
         except PermissionError as e:
-            logger.warning(f"No permission to create {label} at {p}: {e}")
+            logger.warning("No permission to create {} at {}: {}", label, p, e)
         except OSError as e:
-            logger.warning(f"Cannot create {label} at {p}: {e}")
+            logger.warning("Cannot create {} at {}: {}", label, p, e)
 
-    logger.error(f"No writable candidate found for {label}. Tried: {candidates}")
+    logger.error("No writable candidate found for {}. Tried: {}", label, tried)
     # Last resort: exit with a clear message so operators can fix mounts/permissions
     raise SystemExit(
         f"Fatal: {label} is not writable. Please fix your volume mounts or set"
         f" a writable {label} via environment variables. Tried:"
-        f" {', '.join(str(c) for c in candidates)}"
+        f" {', '.join(str(c) for c in tried)}"
     )
 
 
 # Optional override: path reported to clients (e.g. Sonarr) as qBittorrent save path.
 # Useful when AniBridge runs on host but Sonarr runs in a container with a different mount point.
-QBIT_PUBLIC_SAVE_PATH = os.getenv("QBIT_PUBLIC_SAVE_PATH", "").strip()
+# Normalized lexically to an absolute path for reporting. The path usually lives
+# in another container's namespace, so symlinks must not be resolved locally.
+QBIT_PUBLIC_SAVE_PATH = _get("QBIT_PUBLIC_SAVE_PATH")
 if QBIT_PUBLIC_SAVE_PATH:
-    QBIT_PUBLIC_SAVE_PATH = str(Path(QBIT_PUBLIC_SAVE_PATH).expanduser())
-logger.debug(f"QBIT_PUBLIC_SAVE_PATH={QBIT_PUBLIC_SAVE_PATH or '<none>'}")
-
-# Resolve configured paths (treat empty env as unset)
-env_download = os.getenv("DOWNLOAD_DIR")
-env_data = os.getenv("DATA_DIR")
-env_download_path = _str_to_path(env_download.strip() if env_download else None)
-env_data_path = _str_to_path(env_data.strip() if env_data else None)
-REPO_ROOT = _discover_repo_root()
-
-# Default candidates differ for Docker vs local
-default_download = (
-    Path("/data/downloads") if IN_DOCKER else (REPO_ROOT / "data" / "downloads")
-)
-default_data = Path("/data") if IN_DOCKER else (REPO_ROOT / "data")
-
-# Provide sensible cross-image fallbacks: some deploys mount under /app/data
-download_candidates: list[Path] = []
-data_candidates: list[Path] = []
-
-# Note: QBIT_PUBLIC_SAVE_PATH is only for publishing paths to indexers (e.g.,
-# Sonarr/Radarr) and must NOT affect our internal download directory selection.
-# Do not add it to download_candidates to avoid attempting to create container
-# paths on the host (e.g., /downloads) when running outside Docker.
-if env_download_path:
-    download_candidates.append(env_download_path)
-download_candidates.extend(
-    [
-        default_download,
-        Path("/app/data/downloads"),
-        REPO_ROOT / "data" / "downloads",
-        Path("/tmp/anibridge/downloads"),
-    ]
-)
-
-if env_data_path:
-    data_candidates.append(env_data_path)
-data_candidates.extend(
-    [
-        default_data,
-        Path("/app/data"),
-        REPO_ROOT / "data",
-        Path("/tmp/anibridge"),
-    ]
-)
-
-# Create/validate
-DOWNLOAD_DIR = _ensure_dir(download_candidates, "DOWNLOAD_DIR")
-DATA_DIR = _ensure_dir(data_candidates, "DATA_DIR")
-
-# Optional override: path reported to clients (e.g. Sonarr) as qBittorrent save path.
-# Useful when AniBridge runs on host but Sonarr runs in a container with a different mount point.
-# Normalize to absolute for reporting if it points into container
-if QBIT_PUBLIC_SAVE_PATH:
-    try:
-        QBIT_PUBLIC_SAVE_PATH = str(Path(QBIT_PUBLIC_SAVE_PATH).resolve())
-    except Exception:
-        pass
+    QBIT_PUBLIC_SAVE_PATH = os.path.abspath(os.path.expanduser(QBIT_PUBLIC_SAVE_PATH))
 
 # ---- Multi-Site Catalogue Configuration ----
 # Comma-separated list of enabled catalogues (aniworld.to, s.to, megakino)
-CATALOG_SITES = os.getenv("CATALOG_SITES", "aniworld.to,s.to,megakino").strip()
-CATALOG_SITES_LIST = list(
-    dict.fromkeys(s.strip() for s in CATALOG_SITES.split(",") if s.strip())
-)
-logger.debug(f"CATALOG_SITES={CATALOG_SITES_LIST}")
+CATALOG_SITES = _get("CATALOG_SITES", "aniworld.to,s.to,megakino")
+CATALOG_SITES_LIST = _parse_csv_unique(CATALOG_SITES)
 
 # Site-specific configuration
 # AniWorld (anime)
-ANIWORLD_BASE_URL = os.getenv("ANIWORLD_BASE_URL", "https://aniworld.to").strip()
-ANIWORLD_ALPHABET_HTML = Path(
-    os.getenv("ANIWORLD_ALPHABET_HTML", DATA_DIR / "aniworld-alphabeth.html")
-)
-ANIWORLD_ALPHABET_URL = os.getenv(
+ANIWORLD_BASE_URL = _get("ANIWORLD_BASE_URL", "https://aniworld.to")
+ANIWORLD_ALPHABET_URL = _get(
     "ANIWORLD_ALPHABET_URL", f"{ANIWORLD_BASE_URL}/animes-alphabet"
-).strip()
+)
 
 # S.to (series)
-STO_BASE_URL = os.getenv("STO_BASE_URL", "https://s.to").strip()
-STO_ALPHABET_HTML = Path(
-    os.getenv("STO_ALPHABET_HTML", DATA_DIR / "sto-alphabeth.html")
-)
-STO_ALPHABET_URL = os.getenv(
-    "STO_ALPHABET_URL", f"{STO_BASE_URL}/serien?by=alpha"
-).strip()
+STO_BASE_URL = _get("STO_BASE_URL", "https://s.to")
+STO_ALPHABET_URL = _get("STO_ALPHABET_URL", f"{STO_BASE_URL}/serien?by=alpha")
 # Megakino (series/movies)
-MEGAKINO_BASE_URL = os.getenv("MEGAKINO_BASE_URL", "https://megakino1.to").strip()
-MEGAKINO_TITLES_REFRESH_HOURS = float(os.getenv("MEGAKINO_TITLES_REFRESH_HOURS", "12"))
+MEGAKINO_BASE_URL = _get("MEGAKINO_BASE_URL", "https://megakino1.to")
+MEGAKINO_TITLES_REFRESH_HOURS = float(_ENV.get("MEGAKINO_TITLES_REFRESH_HOURS", "12"))
 MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN = int(
-    os.getenv("MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN", "100")
+    _ENV.get("MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN", "100")
 )
 
-logger.debug(
-    f"ANIWORLD_ALPHABET_HTML={ANIWORLD_ALPHABET_HTML}, ANIWORLD_ALPHABET_URL={ANIWORLD_ALPHABET_URL}"
-)
-logger.debug(
-    f"STO_ALPHABET_HTML={STO_ALPHABET_HTML}, STO_ALPHABET_URL={STO_ALPHABET_URL}"
-)
-logger.debug(f"MEGAKINO_BASE_URL={MEGAKINO_BASE_URL}")
-logger.debug(f"MEGAKINO_TITLES_REFRESH_HOURS={MEGAKINO_TITLES_REFRESH_HOURS}")
-logger.debug(f"MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN={MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN}")
 
 # TTL (Stunden) für Live-Index; 0 = nie neu laden (nur einmal pro Prozess)
-ANIWORLD_TITLES_REFRESH_HOURS = float(os.getenv("ANIWORLD_TITLES_REFRESH_HOURS", "24"))
-STO_TITLES_REFRESH_HOURS = float(os.getenv("STO_TITLES_REFRESH_HOURS", "24"))
-logger.debug(f"ANIWORLD_TITLES_REFRESH_HOURS={ANIWORLD_TITLES_REFRESH_HOURS}")
-logger.debug(f"STO_TITLES_REFRESH_HOURS={STO_TITLES_REFRESH_HOURS}")
+ANIWORLD_TITLES_REFRESH_HOURS = float(_ENV.get("ANIWORLD_TITLES_REFRESH_HOURS", "24"))
+STO_TITLES_REFRESH_HOURS = float(_ENV.get("STO_TITLES_REFRESH_HOURS", "24"))
 
 # Quelle/Source-Tag im Release-Namen (typisch: WEB, WEB-DL)
-SOURCE_TAG = os.getenv("SOURCE_TAG", "WEB")
-logger.debug(f"SOURCE_TAG={SOURCE_TAG}")
+SOURCE_TAG = _ENV.get("SOURCE_TAG", "WEB")
 
 # Release Group (am Ende nach Bindestrich angehängt)
 # Can be site-specific: RELEASE_GROUP_ANIWORLD, RELEASE_GROUP_STO
-RELEASE_GROUP = os.getenv("RELEASE_GROUP", "aniworld")
-RELEASE_GROUP_ANIWORLD = os.getenv("RELEASE_GROUP_ANIWORLD", RELEASE_GROUP)
-RELEASE_GROUP_STO = os.getenv("RELEASE_GROUP_STO", "sto")
-logger.debug(f"RELEASE_GROUP={RELEASE_GROUP}")
-logger.debug(
-    f"RELEASE_GROUP_ANIWORLD={RELEASE_GROUP_ANIWORLD}, RELEASE_GROUP_STO={RELEASE_GROUP_STO}"
-)
+RELEASE_GROUP = _ENV.get("RELEASE_GROUP", "aniworld")
+RELEASE_GROUP_ANIWORLD = _ENV.get("RELEASE_GROUP_ANIWORLD", RELEASE_GROUP)
+RELEASE_GROUP_STO = _ENV.get("RELEASE_GROUP_STO", "sto")
+
+
+# --- Lazily resolved settings ---
+# Directory probing (mkdir/resolve on several candidates), the repository-root
+# walk and the catalogue site configs derived from DATA_DIR are only computed
+# on first attribute access via the module-level ``__getattr__`` below (PEP 562).
+# Processes that never touch the filesystem settings (CLI helpers, most unit
+# tests) therefore skip that work entirely.
+def _resolve_repo_root() -> Path:
+    return _discover_repo_root()
+
+
+def _download_candidates() -> Iterator[Path]:
+    # Note: QBIT_PUBLIC_SAVE_PATH is only for publishing paths to indexers (e.g.,
+    # Sonarr/Radarr) and must NOT affect our internal download directory selection.
+    # Do not add it to the candidates to avoid attempting to create container
+    # paths on the host (e.g., /downloads) when running outside Docker.
+    env_download_path = _str_to_path(_get("DOWNLOAD_DIR"))
+    if env_download_path:
+        yield env_download_path
+    # Default candidates differ for Docker vs local; container images also get
+    # a cross-image fallback since some deploys mount under /app/data.
+    if IN_DOCKER:
+        yield Path("/data/downloads")
+        yield Path("/app/data/downloads")
+    yield __getattr__("REPO_ROOT").joinpath("data", "downloads")
+    yield Path("/tmp/anibridge/downloads")
+
+
+def _data_candidates() -> Iterator[Path]:
+    env_data_path = _str_to_path(_get("DATA_DIR"))
+    if env_data_path:
+        yield env_data_path
+    if IN_DOCKER:
+        yield Path("/data")
+        yield Path("/app/data")
+    yield __getattr__("REPO_ROOT") / "data"
+    yield Path("/tmp/anibridge")
+
+
+def _resolve_download_dir() -> Path:
+    return _ensure_dir(_download_candidates(), "DOWNLOAD_DIR")
+
+
+def _resolve_data_dir() -> Path:
+    return _ensure_dir(_data_candidates(), "DATA_DIR")
+
+
+def _resolve_aniworld_alphabet_html() -> Path:
+    raw = _ENV.get("ANIWORLD_ALPHABET_HTML")
+    if raw is None:
+        value = __getattr__("DATA_DIR") / "aniworld-alphabeth.html"
+    else:
+        value = Path(raw)
+    logger.debug("ANIWORLD_ALPHABET_HTML={}", value)
+    return value
+
+
+def _resolve_sto_alphabet_html() -> Path:
+    raw = _ENV.get("STO_ALPHABET_HTML")
+    if raw is None:
+        value = __getattr__("DATA_DIR") / "sto-alphabeth.html"
+    else:
+        value = Path(raw)
+    logger.debug("STO_ALPHABET_HTML={}", value)
+    return value
+
+
+# Static per-site defaults that do not depend on the environment. Kept as
+# tuples so they are built once per import; builders hand out list copies.
+# Language names contain spaces, so the compiler does not intern them; do it
+# explicitly since they are compared against language labels throughout.
+_SITE_DEFAULT_LANGUAGES: dict[str, tuple[str, ...]] = {
+    site: tuple(sys.intern(language) for language in languages)
+    for site, languages in {
+        "aniworld.to": ("German Dub", "German Sub", "English Sub"),
+        "s.to": ("German Dub", "English Dub"),
+        "megakino": ("Deutsch", "German Dub"),
+    }.items()
+}
+
 
-_DEFAULT_SITE_CONFIGS: dict[str, dict[str, Any]] = {
-    "aniworld.to": {
+def _aniworld_site_config() -> dict[str, Any]:
+    return {
         "base_url": ANIWORLD_BASE_URL,
-        "alphabet_html": ANIWORLD_ALPHABET_HTML,
+        "alphabet_html": __getattr__("ANIWORLD_ALPHABET_HTML"),
         "alphabet_url": ANIWORLD_ALPHABET_URL,
         "titles_refresh_hours": ANIWORLD_TITLES_REFRESH_HOURS,
-        "default_languages": ["German Dub", "German Sub", "English Sub"],
+        "default_languages": list(_SITE_DEFAULT_LANGUAGES["aniworld.to"]),
         "release_group": RELEASE_GROUP_ANIWORLD,
-    },
-    "s.to": {
+    }
+
+
+def _sto_site_config() -> dict[str, Any]:
+    return {
         "base_url": STO_BASE_URL,
-        "alphabet_html": STO_ALPHABET_HTML,
+        "alphabet_html": __getattr__("STO_ALPHABET_HTML"),
         "alphabet_url": STO_ALPHABET_URL,
         "titles_refresh_hours": STO_TITLES_REFRESH_HOURS,
-        "default_languages": ["German Dub", "English Dub"],
+        "default_languages": list(_SITE_DEFAULT_LANGUAGES["s.to"]),
         "release_group": RELEASE_GROUP_STO,
-    },
-    "megakino": {
+    }
+
+
+def _megakino_site_config() -> dict[str, Any]:
+    return {
         "base_url": MEGAKINO_BASE_URL,
         "alphabet_html": None,
         "alphabet_url": None,
         "titles_refresh_hours": MEGAKINO_TITLES_REFRESH_HOURS,
-        "default_languages": ["Deutsch", "German Dub"],
+        "default_languages": list(_SITE_DEFAULT_LANGUAGES["megakino"]),
         "release_group": "megakino",
-    },
+    }
+
+
+# Builders run only for enabled sites, so a disabled catalogue never resolves
+# its alphabet HTML path (and with it DATA_DIR). Each call returns a fresh dict.
+_SITE_CONFIG_BUILDERS: dict[str, Callable[[], dict[str, Any]]] = {
+    "aniworld.to": _aniworld_site_config,
+    "s.to": _sto_site_config,
+    "megakino": _megakino_site_config,
 }
 
-CATALOG_SITE_CONFIGS: dict[str, dict[str, Any]] = {}
-for site in CATALOG_SITES_LIST:
-    base_cfg = _DEFAULT_SITE_CONFIGS.get(site)
-    if not base_cfg:
-        logger.warning(
-            f"No built-in configuration for catalogue site '{site}'. Provide environment overrides to enable it."
-        )
-        continue
-    CATALOG_SITE_CONFIGS[site] = deepcopy(base_cfg)
+
+def _resolve_catalog_site_configs() -> dict[str, dict[str, Any]]:
+    site_configs: dict[str, dict[str, Any]] = {}
+    for site in CATALOG_SITES_LIST:
+        builder = _SITE_CONFIG_BUILDERS.get(site)
+        if builder is None:
+            logger.warning(
+                "No built-in configuration for catalogue site '{}'. Provide environment overrides to enable it.",
+                site,
+            )
+            continue
+        site_configs[site] = builder()
+    return site_configs
+
+
+_LAZY_SETTINGS: dict[str, Callable[[], Any]] = {
+    "REPO_ROOT": _resolve_repo_root,
+    "DOWNLOAD_DIR": _resolve_download_dir,
+    "DATA_DIR": _resolve_data_dir,
+    "ANIWORLD_ALPHABET_HTML": _resolve_aniworld_alphabet_html,
+    "STO_ALPHABET_HTML": _resolve_sto_alphabet_html,
+    "CATALOG_SITE_CONFIGS": _resolve_catalog_site_configs,
+}
+_LAZY_LOCK = threading.RLock()
+
+# importlib.reload() re-executes this module in its existing namespace; drop
+# values materialized by a previous run so they are resolved again.
+for _lazy_name in _LAZY_SETTINGS:
+    globals().pop(_lazy_name, None)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a lazily computed setting on first access and cache it.
+
+    The computed value is stored in the module globals, so later lookups
+    (including ``from app.config import NAME``) never reach this hook again.
+    Code that assigns a new value (e.g. the megakino domain resolver) simply
+    overwrites the cached global.
+    """
+    resolver = _LAZY_SETTINGS.get(name)
+    if resolver is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _LAZY_LOCK:
+        module_globals = globals()
+        if name not in module_globals:
+            module_globals[name] = resolver()
+        return module_globals[name]
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_SETTINGS})
+
 
 # ---- Video-host fallback ----
 # Comma-separated list of direct video hosts, for example:
 # "VOE,Filemoon,Streamtape,Vidmoly,Doodstream,LoadX,Luluvdo,Vidoza"
 # Order = priority.
 _default_order = "VOE,Filemoon,Streamtape,Vidmoly,Doodstream,LoadX,Luluvdo,Vidoza"
-_raw = os.getenv("PROVIDER_ORDER", _default_order)
-logger.debug(f"PROVIDER_ORDER raw string: {_raw}")
+_raw = _ENV.get("PROVIDER_ORDER", _default_order)
 _VALID_VIDEO_HOSTS = {
     "VOE",
     "Vidoza",
@@ -330,96 +495,86 @@ def _normalize_video_host_name(name: str) -> str | None:
 # Keep the historical PROVIDER_ORDER env var for compatibility, but use
 # "host" internally for the actual video platforms that expose embeds.
 VIDEO_HOST_ORDER: list[str] = []
-for configured_name in _raw.split(","):
+for configured_name in _parse_csv_unique(_raw):
     canonical_name = _normalize_video_host_name(configured_name)
-    if canonical_name is not None:
-        VIDEO_HOST_ORDER.append(canonical_name)
-        continue
-    stripped_name = configured_name.strip()
-    if stripped_name:
+    if canonical_name is None:
         logger.warning(
             "Unknown video host '{}' configured in PROVIDER_ORDER; dropping it. Valid values: {}",
-            stripped_name,
+            configured_name,
             sorted(_VALID_VIDEO_HOSTS),
         )
+    elif canonical_name not in VIDEO_HOST_ORDER:
+        VIDEO_HOST_ORDER.append(canonical_name)
 PROVIDER_ORDER = VIDEO_HOST_ORDER
-logger.debug(f"VIDEO_HOST_ORDER normalized: {VIDEO_HOST_ORDER}")
 
 # Provider redirect resolution can be slower than direct extractor fetches,
 # especially for VOE after provider-side anti-bot or redirect changes.
 PROVIDER_REDIRECT_TIMEOUT_SECONDS = _as_non_negative_int(
-    os.getenv("PROVIDER_REDIRECT_TIMEOUT_SECONDS"), 12
+    _ENV.get("PROVIDER_REDIRECT_TIMEOUT_SECONDS"), 12
 )
 if PROVIDER_REDIRECT_TIMEOUT_SECONDS < 1:
     PROVIDER_REDIRECT_TIMEOUT_SECONDS = 1
-logger.debug("PROVIDER_REDIRECT_TIMEOUT_SECONDS={}", PROVIDER_REDIRECT_TIMEOUT_SECONDS)
 
 PROVIDER_REDIRECT_RETRIES = _as_non_negative_int(
-    os.getenv("PROVIDER_REDIRECT_RETRIES"), 2
+    _ENV.get("PROVIDER_REDIRECT_RETRIES"), 2
 )
-logger.debug("PROVIDER_REDIRECT_RETRIES={}", PROVIDER_REDIRECT_RETRIES)
 
 PROVIDER_CHALLENGE_BACKOFF_SECONDS = _as_non_negative_int(
-    os.getenv("PROVIDER_CHALLENGE_BACKOFF_SECONDS"), 300
-)
-logger.debug(
-    "PROVIDER_CHALLENGE_BACKOFF_SECONDS={}",
-    PROVIDER_CHALLENGE_BACKOFF_SECONDS,
+    _ENV.get("PROVIDER_CHALLENGE_BACKOFF_SECONDS"), 300
 )
 
+# Fallback video hosts are probed concurrently once the preferred host fails.
+# 1 restores strictly sequential probing.
+PROVIDER_PROBE_CONCURRENCY = _as_positive_int("PROVIDER_PROBE_CONCURRENCY", 4)
+
 # --- Parallelität ---
 # Anzahl gleichzeitiger Downloads (Thread-Pool-Größe)
-MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "3"))
+MAX_CONCURRENCY = int(_ENV.get("MAX_CONCURRENCY", "3"))
 if MAX_CONCURRENCY < 1:
     MAX_CONCURRENCY = 1
-logger.debug(f"MAX_CONCURRENCY={MAX_CONCURRENCY}")
 
 # Per-download bandwidth cap for yt-dlp in bytes/second. 0 = unlimited.
 DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC = _as_non_negative_int(
-    os.getenv("DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC"), 0
+    _ENV.get("DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC"), 0
 )
-logger.debug("DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC={}", DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC)
+
+# Parallel HLS/DASH fragment downloads per job (yt-dlp -N), capped at 32.
+YTDLP_CONCURRENT_FRAGMENTS = min(32, _as_positive_int("YTDLP_CONCURRENT_FRAGMENTS", 8))
+
+# Opt-in: hand progressive (non-HLS) downloads to aria2c when it is on PATH.
+# aria2c reports no per-chunk progress, so cancellation only applies between
+# downloads; it is also skipped while a rate limit is configured.
+YTDLP_ARIA2C_ENABLED = _as_bool(_ENV.get("YTDLP_ARIA2C_ENABLED"), False)
 
 # ---- Torznab / Indexer-Konfiguration ----
-INDEXER_NAME = os.getenv("INDEXER_NAME", "AniBridge Torznab")
+INDEXER_NAME = _ENV.get("INDEXER_NAME", "AniBridge Torznab")
 # Optionaler API-Key; wenn gesetzt, muss ?apikey=... passen
-INDEXER_API_KEY = os.getenv("INDEXER_API_KEY", "").strip()
+INDEXER_API_KEY = _get("INDEXER_API_KEY")
 # Kategorien-IDs (Torznab/Newznab) – 5070 = TV/Anime (de-facto-Standard)
-TORZNAB_CAT_ANIME = int(os.getenv("TORZNAB_CAT_ANIME", "5070"))
-TORZNAB_CAT_MOVIE = int(os.getenv("TORZNAB_CAT_MOVIE", "2000"))
+TORZNAB_CAT_ANIME = int(_ENV.get("TORZNAB_CAT_ANIME", "5070"))
+TORZNAB_CAT_MOVIE = int(_ENV.get("TORZNAB_CAT_MOVIE", "2000"))
 
 # Availability TTL (Stunden) für Semi-Cache (Qualität & Sprache je Episode)
-AVAILABILITY_TTL_HOURS = float(os.getenv("AVAILABILITY_TTL_HOURS", "24"))
-logger.debug(f"AVAILABILITY_TTL_HOURS={AVAILABILITY_TTL_HOURS}")
+AVAILABILITY_TTL_HOURS = float(_ENV.get("AVAILABILITY_TTL_HOURS", "24"))
 
 # ---- Fake Seeder/Leecher für Torznab-Items (für Prowlarr-Minimum) ----
-TORZNAB_FAKE_SEEDERS = int(os.getenv("TORZNAB_FAKE_SEEDERS", "999"))
-TORZNAB_FAKE_LEECHERS = int(os.getenv("TORZNAB_FAKE_LEECHERS", "787"))
-logger.debug(
-    f"TORZNAB_FAKE_SEEDERS={TORZNAB_FAKE_SEEDERS}, TORZNAB_FAKE_LEECHERS={TORZNAB_FAKE_LEECHERS}"
-)
+TORZNAB_FAKE_SEEDERS = int(_ENV.get("TORZNAB_FAKE_SEEDERS", "999"))
+TORZNAB_FAKE_LEECHERS = int(_ENV.get("TORZNAB_FAKE_LEECHERS", "787"))
 
 # --- Torznab Test-Eintrag für t=search ohne q (Connectivity Check) ---
 TORZNAB_RETURN_TEST_RESULT = (
-    os.getenv("TORZNAB_RETURN_TEST_RESULT", "true").strip().lower() == "true"
-)
-TORZNAB_TEST_TITLE = os.getenv("TORZNAB_TEST_TITLE", "AniBridge Connectivity Test")
-TORZNAB_TEST_SLUG = os.getenv("TORZNAB_TEST_SLUG", "connectivity-test")
-TORZNAB_TEST_SEASON = int(os.getenv("TORZNAB_TEST_SEASON", "1"))
-TORZNAB_TEST_EPISODE = int(os.getenv("TORZNAB_TEST_EPISODE", "1"))
-TORZNAB_TEST_LANGUAGE = os.getenv("TORZNAB_TEST_LANGUAGE", "German Dub")
-TORZNAB_SEASON_SEARCH_MODE = (
-    os.getenv("TORZNAB_SEASON_SEARCH_MODE", "fast").strip().lower()
-)
-if TORZNAB_SEASON_SEARCH_MODE not in {"fast", "strict"}:
-    logger.warning(
-        "Invalid TORZNAB_SEASON_SEARCH_MODE='{}', defaulting to 'fast'",
-        TORZNAB_SEASON_SEARCH_MODE,
-    )
-    TORZNAB_SEASON_SEARCH_MODE = "fast"
-_torznab_season_search_max_episodes_raw = os.getenv(
-    "TORZNAB_SEASON_SEARCH_MAX_EPISODES"
-)
+    _get("TORZNAB_RETURN_TEST_RESULT", "true", lower=True) == "true"
+)
+TORZNAB_TEST_TITLE = _ENV.get("TORZNAB_TEST_TITLE", "AniBridge Connectivity Test")
+TORZNAB_TEST_SLUG = _ENV.get("TORZNAB_TEST_SLUG", "connectivity-test")
+TORZNAB_TEST_SEASON = int(_ENV.get("TORZNAB_TEST_SEASON", "1"))
+TORZNAB_TEST_EPISODE = int(_ENV.get("TORZNAB_TEST_EPISODE", "1"))
+TORZNAB_TEST_LANGUAGE = _ENV.get("TORZNAB_TEST_LANGUAGE", "German Dub")
+_TORZNAB_SEASON_SEARCH_MODES = frozenset({"fast", "strict"})
+TORZNAB_SEASON_SEARCH_MODE = _as_enum(
+    "TORZNAB_SEASON_SEARCH_MODE", "fast", _TORZNAB_SEASON_SEARCH_MODES
+)
+_torznab_season_search_max_episodes_raw = _ENV.get("TORZNAB_SEASON_SEARCH_MAX_EPISODES")
 _torznab_season_search_max_episodes_parsed = _as_non_negative_int(
     _torznab_season_search_max_episodes_raw, 60
 )
@@ -435,7 +590,7 @@ TORZNAB_SEASON_SEARCH_MAX_EPISODES = max(
     1,
     _torznab_season_search_max_episodes_parsed,
 )
-_torznab_season_search_max_consecutive_misses_raw = os.getenv(
+_torznab_season_search_max_consecutive_misses_raw = _ENV.get(
     "TORZNAB_SEASON_SEARCH_MAX_CONSECUTIVE_MISSES"
 )
 _torznab_season_search_max_consecutive_misses_parsed = _as_non_negative_int(
@@ -453,165 +608,102 @@ TORZNAB_SEASON_SEARCH_MAX_CONSECUTIVE_MISSES = max(
     1,
     _torznab_season_search_max_consecutive_misses_parsed,
 )
-logger.debug(
-    (
-        "Torznab season-search mode={} guardrails: max_episodes={} "
-        "max_consecutive_misses={}"
-    ),
-    TORZNAB_SEASON_SEARCH_MODE,
-    TORZNAB_SEASON_SEARCH_MAX_EPISODES,
-    TORZNAB_SEASON_SEARCH_MAX_CONSECUTIVE_MISSES,
-)
 
 # Metadata-backed specials mapping (Option C)
 SPECIALS_METADATA_ENABLED = _as_bool(
-    os.getenv("SPECIALS_METADATA_ENABLED", "true"), True
+    _ENV.get("SPECIALS_METADATA_ENABLED", "true"), True
 )
-try:
-    SPECIALS_METADATA_TIMEOUT_SECONDS = float(
-        os.getenv("SPECIALS_METADATA_TIMEOUT_SECONDS", "8")
-    )
-except ValueError:
-    SPECIALS_METADATA_TIMEOUT_SECONDS = 8.0
+SPECIALS_METADATA_TIMEOUT_SECONDS = _as_float("SPECIALS_METADATA_TIMEOUT_SECONDS", 8.0)
 if SPECIALS_METADATA_TIMEOUT_SECONDS <= 0:
     SPECIALS_METADATA_TIMEOUT_SECONDS = 8.0
 
-try:
-    SPECIALS_METADATA_CACHE_TTL_MINUTES = int(
-        os.getenv("SPECIALS_METADATA_CACHE_TTL_MINUTES", "360")
-    )
-except ValueError:
-    SPECIALS_METADATA_CACHE_TTL_MINUTES = 360
-if SPECIALS_METADATA_CACHE_TTL_MINUTES < 0:
-    SPECIALS_METADATA_CACHE_TTL_MINUTES = 0
-
-try:
-    SPECIALS_MATCH_CONFIDENCE_THRESHOLD = float(
-        os.getenv("SPECIALS_MATCH_CONFIDENCE_THRESHOLD", "0.50")
-    )
-except ValueError:
-    SPECIALS_MATCH_CONFIDENCE_THRESHOLD = 0.50
-SPECIALS_MATCH_CONFIDENCE_THRESHOLD = min(
-    1.0, max(0.0, SPECIALS_MATCH_CONFIDENCE_THRESHOLD)
+SPECIALS_METADATA_CACHE_TTL_MINUTES = max(
+    0, _as_int("SPECIALS_METADATA_CACHE_TTL_MINUTES", 360)
 )
-logger.debug(
-    "SPECIALS metadata config: enabled={} timeout={} cache_ttl_minutes={} threshold={}",
-    SPECIALS_METADATA_ENABLED,
-    SPECIALS_METADATA_TIMEOUT_SECONDS,
-    SPECIALS_METADATA_CACHE_TTL_MINUTES,
-    SPECIALS_MATCH_CONFIDENCE_THRESHOLD,
+
+SPECIALS_MATCH_CONFIDENCE_THRESHOLD = min(
+    1.0,
+    max(0.0, _as_float("SPECIALS_MATCH_CONFIDENCE_THRESHOLD", 0.50)),
 )
 
 # --- Cleanup behavior ---
 
 
 DELETE_FILES_ON_TORRENT_DELETE = _as_bool(
-    os.getenv("DELETE_FILES_ON_TORRENT_DELETE", "true"), True
+    _ENV.get("DELETE_FILES_ON_TORRENT_DELETE", "true"), True
 )
 DOWNLOADS_TTL_HOURS = float(
-    os.getenv("DOWNLOADS_TTL_HOURS", "0")
+    _ENV.get("DOWNLOADS_TTL_HOURS", "0")
 )  # 0 disables TTL cleanup
-CLEANUP_SCAN_INTERVAL_MIN = int(os.getenv("CLEANUP_SCAN_INTERVAL_MIN", "30"))
-logger.debug(
-    f"DELETE_FILES_ON_TORRENT_DELETE={DELETE_FILES_ON_TORRENT_DELETE}, DOWNLOADS_TTL_HOURS={DOWNLOADS_TTL_HOURS}, CLEANUP_SCAN_INTERVAL_MIN={CLEANUP_SCAN_INTERVAL_MIN}"
-)
+CLEANUP_SCAN_INTERVAL_MIN = int(_ENV.get("CLEANUP_SCAN_INTERVAL_MIN", "30"))
 
 # --- STRM support ---
 # Controls whether Torznab emits STRM variants and whether the qBittorrent shim
 # turns those variants into .strm files instead of downloading media.
-STRM_FILES_MODE = os.getenv("STRM_FILES_MODE", "no").strip().lower()
-if STRM_FILES_MODE not in ("no", "both", "only"):
-    logger.warning(f"Invalid STRM_FILES_MODE={STRM_FILES_MODE!r}; defaulting to 'no'.")
-    STRM_FILES_MODE = "no"
-logger.debug(f"STRM_FILES_MODE={STRM_FILES_MODE}")
+_STRM_FILES_MODES = frozenset({"no", "both", "only"})
+STRM_FILES_MODE = _as_enum("STRM_FILES_MODE", "no", _STRM_FILES_MODES)
 
 # --- STRM proxy streaming ---
 # Controls whether STRM files point to AniBridge proxy URLs or direct provider URLs.
-STRM_PROXY_MODE = os.getenv("STRM_PROXY_MODE", "direct").strip().lower()
-if STRM_PROXY_MODE not in ("direct", "proxy", "redirect"):
+# Accepted modes that are not implemented yet, mapped to the mode used instead.
+_STRM_PROXY_MODE_FALLBACKS = {"redirect": "proxy"}
+_STRM_PROXY_MODES = frozenset({"direct", "proxy", *_STRM_PROXY_MODE_FALLBACKS})
+STRM_PROXY_MODE = _as_enum("STRM_PROXY_MODE", "direct", _STRM_PROXY_MODES)
+if STRM_PROXY_MODE in _STRM_PROXY_MODE_FALLBACKS:
+    _strm_proxy_mode_requested = STRM_PROXY_MODE
+    STRM_PROXY_MODE = _STRM_PROXY_MODE_FALLBACKS[_strm_proxy_mode_requested]
     logger.warning(
-        f"Invalid STRM_PROXY_MODE={STRM_PROXY_MODE!r}; defaulting to 'direct'."
+        "STRM_PROXY_MODE={} is not implemented; using {} streaming.",
+        _strm_proxy_mode_requested,
+        STRM_PROXY_MODE,
     )
-    STRM_PROXY_MODE = "direct"
-if STRM_PROXY_MODE == "redirect":
-    logger.warning(
-        "STRM_PROXY_MODE=redirect is not implemented; using proxy streaming."
-    )
-    STRM_PROXY_MODE = "proxy"
 
 # Public base URL used to build stable STRM proxy URLs (required for proxy mode).
-STRM_PUBLIC_BASE_URL = os.getenv("STRM_PUBLIC_BASE_URL", "").strip()
+STRM_PUBLIC_BASE_URL = _get("STRM_PUBLIC_BASE_URL")
 
 # Auth mode for proxy endpoints: none, token (HMAC), or apikey.
-STRM_PROXY_AUTH = os.getenv("STRM_PROXY_AUTH", "token").strip().lower()
-if STRM_PROXY_AUTH not in ("none", "token", "apikey"):
-    logger.warning(
-        f"Invalid STRM_PROXY_AUTH={STRM_PROXY_AUTH!r}; defaulting to 'token'."
-    )
-    STRM_PROXY_AUTH = "token"
+_STRM_PROXY_AUTH_MODES = frozenset({"none", "token", "apikey"})
+STRM_PROXY_AUTH = _as_enum("STRM_PROXY_AUTH", "token", _STRM_PROXY_AUTH_MODES)
 
 # Shared secret for STRM proxy auth. Used for token signatures and API key mode.
-STRM_PROXY_SECRET = os.getenv("STRM_PROXY_SECRET", "").strip()
+STRM_PROXY_SECRET = _get("STRM_PROXY_SECRET")
 
 # Optional allowlist of upstream hosts for STRM proxying (comma-separated).
-_strm_upstream_allowlist_raw = os.getenv("STRM_PROXY_UPSTREAM_ALLOWLIST", "").strip()
-STRM_PROXY_UPSTREAM_ALLOWLIST = {
-    host.strip().lower()
-    for host in _strm_upstream_allowlist_raw.split(",")
-    if host.strip()
-}
+STRM_PROXY_UPSTREAM_ALLOWLIST: frozenset[str] = frozenset(
+    _parse_csv_unique(_get("STRM_PROXY_UPSTREAM_ALLOWLIST", lower=True))
+)
 
 # Cache TTL (seconds) for resolved STRM URLs. 0 disables expiration.
-_strm_cache_ttl_raw = os.getenv("STRM_PROXY_CACHE_TTL_SECONDS", "0").strip()
-try:
-    STRM_PROXY_CACHE_TTL_SECONDS = int(_strm_cache_ttl_raw or 0)
-except ValueError:
-    logger.warning(
-        f"Invalid STRM_PROXY_CACHE_TTL_SECONDS={_strm_cache_ttl_raw!r}; defaulting to 0."
-    )
-    STRM_PROXY_CACHE_TTL_SECONDS = 0
+STRM_PROXY_CACHE_TTL_SECONDS = _as_int("STRM_PROXY_CACHE_TTL_SECONDS", 0)
 
 # Token TTL (seconds) for signed STRM proxy URLs.
-_strm_token_ttl_raw = os.getenv("STRM_PROXY_TOKEN_TTL_SECONDS", "900").strip()
-try:
-    STRM_PROXY_TOKEN_TTL_SECONDS = int(_strm_token_ttl_raw or 0)
-except ValueError:
-    logger.warning(
-        f"Invalid STRM_PROXY_TOKEN_TTL_SECONDS={_strm_token_ttl_raw!r}; defaulting to 900."
-    )
-    STRM_PROXY_TOKEN_TTL_SECONDS = 900
-if STRM_PROXY_TOKEN_TTL_SECONDS <= 0:
-    logger.warning("STRM_PROXY_TOKEN_TTL_SECONDS must be positive; defaulting to 900.")
-    STRM_PROXY_TOKEN_TTL_SECONDS = 900
+STRM_PROXY_TOKEN_TTL_SECONDS = _as_positive_int("STRM_PROXY_TOKEN_TTL_SECONDS", 900)
 
 STRM_PROXY_ENABLED = STRM_PROXY_MODE == "proxy"
-if STRM_PROXY_ENABLED and not STRM_PUBLIC_BASE_URL:
-    logger.error("STRM proxy mode is enabled but STRM_PUBLIC_BASE_URL is not set.")
-    raise RuntimeError("STRM_PUBLIC_BASE_URL is required when STRM_PROXY_MODE=proxy.")
-if STRM_PROXY_ENABLED and STRM_PROXY_AUTH != "none" and not STRM_PROXY_SECRET:
-    logger.error("STRM proxy auth enabled but STRM_PROXY_SECRET is not set.")
-    raise RuntimeError("STRM_PROXY_SECRET is required when STRM_PROXY_AUTH is enabled.")
-logger.debug(
-    "STRM proxy config: mode={} auth={} cache_ttl_seconds={} token_ttl_seconds={} allowlist_count={}",
-    STRM_PROXY_MODE,
-    STRM_PROXY_AUTH,
-    STRM_PROXY_CACHE_TTL_SECONDS,
-    STRM_PROXY_TOKEN_TTL_SECONDS,
-    len(STRM_PROXY_UPSTREAM_ALLOWLIST),
-)
+# Settings proxy mode cannot run without, checked in order so startup fails on
+# the first missing one: (name, value, condition that makes it required).
+if STRM_PROXY_ENABLED:
+    _strm_required: list[tuple[str, str, str]] = [
+        ("STRM_PUBLIC_BASE_URL", STRM_PUBLIC_BASE_URL, "STRM_PROXY_MODE=proxy")
+    ]
+    if STRM_PROXY_AUTH != "none":
+        _strm_required.append(
+            ("STRM_PROXY_SECRET", STRM_PROXY_SECRET, "STRM_PROXY_AUTH is enabled")
+        )
+    for _strm_name, _strm_value, _strm_reason in _strm_required:
+        if not _strm_value:
+            logger.error("{} is not set but {}.", _strm_name, _strm_reason)
+            raise RuntimeError(f"{_strm_name} is required when {_strm_reason}.")
 
 # --- Progress rendering ---
-PROGRESS_FORCE_BAR = _as_bool(os.getenv("PROGRESS_FORCE_BAR", None), False)
-PROGRESS_STEP_PERCENT = max(1, int(os.getenv("PROGRESS_STEP_PERCENT", "5")))
-logger.debug(
-    f"PROGRESS_FORCE_BAR={PROGRESS_FORCE_BAR}, PROGRESS_STEP_PERCENT={PROGRESS_STEP_PERCENT}"
-)
+PROGRESS_FORCE_BAR = _as_bool(_ENV.get("PROGRESS_FORCE_BAR"), False)
+PROGRESS_STEP_PERCENT = max(1, int(_ENV.get("PROGRESS_STEP_PERCENT", "5")))
 
-ANIBRIDGE_RELOAD = _as_bool(os.getenv("ANIBRIDGE_RELOAD", None), False)
-ANIBRIDGE_TEST_MODE = _as_bool(os.getenv("ANIBRIDGE_TEST_MODE", None), False)
-DB_MIGRATE_ON_STARTUP = _as_bool(os.getenv("DB_MIGRATE_ON_STARTUP", None), True)
-ANIBRIDGE_HOST = os.getenv("ANIBRIDGE_HOST", "0.0.0.0").strip() or "0.0.0.0"
-ANIBRIDGE_PORT = int(os.getenv("ANIBRIDGE_PORT", "8000") or 8000)
+ANIBRIDGE_RELOAD = _as_bool(_ENV.get("ANIBRIDGE_RELOAD"), False)
+ANIBRIDGE_TEST_MODE = _as_bool(_ENV.get("ANIBRIDGE_TEST_MODE"), False)
+DB_MIGRATE_ON_STARTUP = _as_bool(_ENV.get("DB_MIGRATE_ON_STARTUP"), True)
+ANIBRIDGE_HOST = _get("ANIBRIDGE_HOST", "0.0.0.0") or "0.0.0.0"
+ANIBRIDGE_PORT = int(_ENV.get("ANIBRIDGE_PORT", "8000") or 8000)
 
 # --- CORS ---
 # Browser-based API clients (like the docs "try it out") need CORS enabled.
@@ -621,19 +713,73 @@ ANIBRIDGE_PORT = int(os.getenv("ANIBRIDGE_PORT", "8000") or 8000)
 # - "*": allow all origins
 # - Comma-separated list: allow only these origins
 # - "off" / "none": disable CORS entirely (no middleware)
-_cors_raw = os.getenv("ANIBRIDGE_CORS_ORIGINS", "").strip()
-_cors_raw_lower = _cors_raw.lower()
-if _cors_raw_lower in {"off", "none"}:
+_cors_raw = _get("ANIBRIDGE_CORS_ORIGINS")
+if _cors_raw.lower() in {"off", "none"}:
     ANIBRIDGE_CORS_ORIGINS: list[str] = []
 elif not _cors_raw or _cors_raw == "*":
     ANIBRIDGE_CORS_ORIGINS = ["*"]
 else:
-    ANIBRIDGE_CORS_ORIGINS = [o.strip() for o in _cors_raw.split(",") if o.strip()]
-logger.debug(f"ANIBRIDGE_CORS_ORIGINS={ANIBRIDGE_CORS_ORIGINS}")
+    ANIBRIDGE_CORS_ORIGINS = _parse_csv_unique(_cors_raw)
 
 # Controls Access-Control-Allow-Credentials when CORS is enabled and origins are
 # not a wildcard. For wildcard origins, credentials are always disabled.
 ANIBRIDGE_CORS_ALLOW_CREDENTIALS = _as_bool(
-    os.getenv("ANIBRIDGE_CORS_ALLOW_CREDENTIALS", "true"), True
+    _ENV.get("ANIBRIDGE_CORS_ALLOW_CREDENTIALS", "true"), True
+)
+
+# One structured record instead of a debug line per setting; the payload is only
+# built when DEBUG logging is enabled. Lazily resolved paths are left out so that
+# logging never forces directory probing.
+logger.opt(lazy=True).debug(
+    "Resolved configuration: {}",
+    lambda: {
+        "IN_DOCKER": IN_DOCKER,
+        "QBIT_PUBLIC_SAVE_PATH": QBIT_PUBLIC_SAVE_PATH or "<none>",
+        "CATALOG_SITES": CATALOG_SITES_LIST,
+        "ANIWORLD_ALPHABET_URL": ANIWORLD_ALPHABET_URL,
+        "ANIWORLD_TITLES_REFRESH_HOURS": ANIWORLD_TITLES_REFRESH_HOURS,
+        "STO_ALPHABET_URL": STO_ALPHABET_URL,
+        "STO_TITLES_REFRESH_HOURS": STO_TITLES_REFRESH_HOURS,
+        "MEGAKINO_BASE_URL": MEGAKINO_BASE_URL,
+        "MEGAKINO_TITLES_REFRESH_HOURS": MEGAKINO_TITLES_REFRESH_HOURS,
+        "MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN": MEGAKINO_DOMAIN_CHECK_INTERVAL_MIN,
+        "SOURCE_TAG": SOURCE_TAG,
+        "RELEASE_GROUP": RELEASE_GROUP,
+        "RELEASE_GROUP_ANIWORLD": RELEASE_GROUP_ANIWORLD,
+        "RELEASE_GROUP_STO": RELEASE_GROUP_STO,
+        "VIDEO_HOST_ORDER": VIDEO_HOST_ORDER,
+        "PROVIDER_REDIRECT_TIMEOUT_SECONDS": PROVIDER_REDIRECT_TIMEOUT_SECONDS,
+        "PROVIDER_REDIRECT_RETRIES": PROVIDER_REDIRECT_RETRIES,
+        "PROVIDER_CHALLENGE_BACKOFF_SECONDS": PROVIDER_CHALLENGE_BACKOFF_SECONDS,
+        "PROVIDER_PROBE_CONCURRENCY": PROVIDER_PROBE_CONCURRENCY,
+        "MAX_CONCURRENCY": MAX_CONCURRENCY,
+        "DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC": DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC,
+        "YTDLP_CONCURRENT_FRAGMENTS": YTDLP_CONCURRENT_FRAGMENTS,
+        "YTDLP_ARIA2C_ENABLED": YTDLP_ARIA2C_ENABLED,
+        "AVAILABILITY_TTL_HOURS": AVAILABILITY_TTL_HOURS,
+        "TORZNAB_FAKE_SEEDERS": TORZNAB_FAKE_SEEDERS,
+        "TORZNAB_FAKE_LEECHERS": TORZNAB_FAKE_LEECHERS,
+        "TORZNAB_SEASON_SEARCH_MODE": TORZNAB_SEASON_SEARCH_MODE,
+        "TORZNAB_SEASON_SEARCH_MAX_EPISODES": TORZNAB_SEASON_SEARCH_MAX_EPISODES,
+        "TORZNAB_SEASON_SEARCH_MAX_CONSECUTIVE_MISSES": (
+            TORZNAB_SEASON_SEARCH_MAX_CONSECUTIVE_MISSES
+        ),
+        "SPECIALS_METADATA_ENABLED": SPECIALS_METADATA_ENABLED,
+        "SPECIALS_METADATA_TIMEOUT_SECONDS": SPECIALS_METADATA_TIMEOUT_SECONDS,
+        "SPECIALS_METADATA_CACHE_TTL_MINUTES": SPECIALS_METADATA_CACHE_TTL_MINUTES,
+        "SPECIALS_MATCH_CONFIDENCE_THRESHOLD": SPECIALS_MATCH_CONFIDENCE_THRESHOLD,
+        "DELETE_FILES_ON_TORRENT_DELETE": DELETE_FILES_ON_TORRENT_DELETE,
+        "DOWNLOADS_TTL_HOURS": DOWNLOADS_TTL_HOURS,
+        "CLEANUP_SCAN_INTERVAL_MIN": CLEANUP_SCAN_INTERVAL_MIN,
+        "STRM_FILES_MODE": STRM_FILES_MODE,
+        "STRM_PROXY_MODE": STRM_PROXY_MODE,
+        "STRM_PROXY_AUTH": STRM_PROXY_AUTH,
+        "STRM_PROXY_CACHE_TTL_SECONDS": STRM_PROXY_CACHE_TTL_SECONDS,
+        "STRM_PROXY_TOKEN_TTL_SECONDS": STRM_PROXY_TOKEN_TTL_SECONDS,
+        "STRM_PROXY_UPSTREAM_ALLOWLIST_COUNT": len(STRM_PROXY_UPSTREAM_ALLOWLIST),
+        "PROGRESS_FORCE_BAR": PROGRESS_FORCE_BAR,
+        "PROGRESS_STEP_PERCENT": PROGRESS_STEP_PERCENT,
+        "ANIBRIDGE_CORS_ORIGINS": ANIBRIDGE_CORS_ORIGINS,
+        "ANIBRIDGE_CORS_ALLOW_CREDENTIALS": ANIBRIDGE_CORS_ALLOW_CREDENTIALS,
+    },
 )
-logger.debug(f"ANIBRIDGE_CORS_ALLOW_CREDENTIALS={ANIBRIDGE_CORS_ALLOW_CREDENTIALS}")
@@ -1,21 +1,20 @@
 from __future__ import annotations
 
-from dotenv import load_dotenv
 from app.utils.logger import config as configure_logger, ensure_log_path
 from app.infrastructure.terminal_logger import TerminalLogger
-from app.config import DATA_DIR
+from app.config import DATA_DIR, load_dotenv_once
 
 
 def init() -> None:
     """Initialize environment and logging early.
 
-    - Loads .env
+    - Loads .env (no-op when app.config already applied it)
     - Configures loguru
     - Ensures log path exists under DATA_DIR
     - Installs TerminalLogger to mirror stdout/stderr to file
     - Configures loguru after the terminal tee is installed
     """
-    load_dotenv()
+    load_dotenv_once()
     ensure_log_path(DATA_DIR)
     TerminalLogger(DATA_DIR)
     # Loguru retains the stream object passed to logger.add(). Configure it
@@ -7,10 +7,14 @@ from loguru import logger
 from app.config import PROVIDER_ORDER
 from app.utils.naming import rename_to_release
 from app.providers.megakino.client import get_default_client
-from .errors import DownloadError
+from .errors import DownloadError, _is_transient
 from .episode import build_episode
 from .language import normalize_language
-from .provider_resolution import get_direct_url_with_fallback
+from .provider_resolution import (
+    _probe_providers,
+    forget_direct_url,
+    get_direct_url_with_fallback,
+)
 from .types import Provider, ProgressCb
 from .ytdlp import _ydl_download
 
@@ -58,7 +62,7 @@ def download_episode(
         Path: Final path to the renamed release file.
 
     Raises:
-        DownloadError: When URL resolution or download ultimately fails after all fallback attempts.
+        DownloadError: When URL resolution or download ultimately fails after all fallback attempts. Cancellation and disk-full errors are re-raised without trying other hosts.
     """
     language = normalize_language(language)
     release_override = None
@@ -83,12 +87,9 @@ def download_episode(
         is_movie = bool(entry and entry.kind == "film")
         if is_movie:
             logger.debug("Megakino slug '{}' classified as movie.", slug)
-        provider_candidates = []
-        if provider:
-            provider_candidates.append(provider)
-        for prov_name in PROVIDER_ORDER:
-            if prov_name not in provider_candidates:
-                provider_candidates.append(prov_name)
+        provider_candidates: list[Optional[str]] = list(
+            dict.fromkeys([provider, *PROVIDER_ORDER] if provider else PROVIDER_ORDER)
+        )
         if not provider_candidates:
             provider_candidates = [None]
 
@@ -157,6 +158,8 @@ def download_episode(
                 if result is not None:
                     return result
             except Exception as exc:
+                if not _is_transient(exc):
+                    raise
                 last_error = exc
                 logger.warning(
                     "Megakino download attempt failed (host={}): {}",
@@ -193,19 +196,36 @@ def download_episode(
         )
     except Exception as exc:
         msg = str(exc)
+        if not _is_transient(exc):
+            logger.warning("Download failed without host fallback: {}", msg)
+            raise
         logger.warning("Primary download failed: {}", msg)
+        forget_direct_url(ep, chosen, language)
 
         tried_alt = False
-        providers_left = [
-            provider_name
-            for provider_name in PROVIDER_ORDER
-            if provider_name != (provider or "")
-        ]
-        for provider_name in providers_left:
+        # Hosts whose URL already failed (or that yielded none) are excluded;
+        # each round probes the rest concurrently and downloads from the
+        # highest-priority host that resolves.
+        failed_hosts = {chosen, provider or ""}
+        while not tried_alt:
+            if stop_event is not None and stop_event.is_set():
+                break
+            providers_left = [
+                provider_name
+                for provider_name in PROVIDER_ORDER
+                if provider_name not in failed_hosts
+            ]
+            if not providers_left:
+                break
+            try:
+                found = _probe_providers(ep, providers_left, language, {})
+            except Exception as exc3:
+                logger.warning("Alternate provider resolution failed: {}", exc3)
+                break
+            if not found:
+                break
+            direct3, chosen3 = found
             try:
-                direct3, chosen3 = get_direct_url_with_fallback(
-                    ep, preferred=provider_name, language=language
-                )
                 logger.info("Retrying download via alternate provider {}", chosen3)
                 temp_path, info = _ydl_download(
                     direct3,
@@ -216,11 +236,14 @@ def download_episode(
                     stop_event=stop_event,
                 )
                 tried_alt = True
-                break
             except Exception as exc3:
+                if not _is_transient(exc3):
+                    raise
+                forget_direct_url(ep, chosen3, language)
+                failed_hosts.add(chosen3)
                 logger.warning(
                     "Alternate provider {} failed to download: {}",
-                    provider_name,
+                    chosen3,
                     exc3,
                 )
 
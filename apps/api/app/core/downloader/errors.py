@@ -1,5 +1,10 @@
+import errno
+import re
 from typing import List
 
+# Failures that no other video host can fix: cancellation and a full disk.
+_NON_TRANSIENT_MSG_RE = re.compile(r"cancell?ed|no space left on device", re.IGNORECASE)
+
 
 class DownloadError(Exception):
     """Base exception for downloader failures and retry exhaustion."""
@@ -25,3 +30,23 @@ class LanguageUnavailableError(DownloadError):
         super().__init__(
             f"Language '{requested}' not available. Available: {', '.join(available) or 'none'}"
         )
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Return whether retrying a failed download via another video host could succeed.
+
+    Cancellation and disk-full errors are not transient. The whole exception chain is inspected because yt-dlp and `_ydl_download` wrap the original error.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, KeyboardInterrupt):
+            return False
+        if isinstance(current, OSError) and current.errno == errno.ENOSPC:
+            return False
+        if _NON_TRANSIENT_MSG_RE.search(str(current)):
+            return False
+        current = current.__cause__ or current.__context__
+    return True
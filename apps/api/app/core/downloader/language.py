@@ -1,9 +1,13 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 from loguru import logger
 
-_LANG_ALIASES = {
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+
+_RAW_LANG_ALIASES = {
     "german": "German Dub",
     "deutsch": "German Dub",
     "ger": "German Dub",
@@ -23,6 +27,28 @@ _LANG_ALIASES = {
     "en-dub": "English Dub",
     "endub": "English Dub",
 }
+_CANONICAL_LANGUAGES = frozenset(_RAW_LANG_ALIASES.values())
+# Keys are stored in the same cleaned form normalize_language() looks up, so
+# hyphenated aliases like "de-sub" match. Canonical labels map to themselves,
+# so e.g. "german dub" or "German-Sub" normalize like the shorthand forms.
+_LANG_ALIASES = MappingProxyType(
+    {
+        **{
+            _NON_ALPHA_RE.sub("", canonical.lower()): canonical
+            for canonical in _CANONICAL_LANGUAGES
+        },
+        **{
+            _NON_ALPHA_RE.sub("", alias): canonical
+            for alias, canonical in _RAW_LANG_ALIASES.items()
+        },
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _alias_for(lang: str) -> str:
+    """Return the canonical label for a non-empty `lang`, or `lang` itself (pure, memoized)."""
+    return _LANG_ALIASES.get(_NON_ALPHA_RE.sub("", lang.lower()), lang)
 
 
 def normalize_language(lang: Optional[str]) -> str:
@@ -36,10 +62,14 @@ def normalize_language(lang: Optional[str]) -> str:
 
     Returns:
         str: The canonical language label for known variants, or the original `lang` value when no canonical mapping is found.
+
+    The alias lookup is memoized per distinct input, since callers re-normalize the same few labels on every provider attempt.
     """
     if not lang:
         return "German Dub"
-    cleaned = re.sub(r"[^a-z]", "", lang.lower())
-    normalized = _LANG_ALIASES.get(cleaned, lang)
+    if lang in _CANONICAL_LANGUAGES:
+        # Most callers pass labels that were normalized upstream already.
+        return lang
+    normalized = _alias_for(lang)
     logger.debug("Normalized language '{}' -> '{}'", lang, normalized)
     return normalized
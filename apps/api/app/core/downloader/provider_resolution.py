@@ -1,18 +1,48 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Tuple, TYPE_CHECKING
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING, Union
 
 from loguru import logger
 
-from app.config import PROVIDER_ORDER
+from app.config import PROVIDER_ORDER, PROVIDER_PROBE_CONCURRENCY
 from .errors import DownloadError, LanguageUnavailableError
 from .language import normalize_language
 
 if TYPE_CHECKING:
     from aniworld.models import Episode
 
-_AVAIL_RE = re.compile(r"Available languages:\s*\[([^\]]*)\]", re.IGNORECASE)
+_AVAIL_MARKER_RE = re.compile(re.escape("available languages:"), re.IGNORECASE)
+
+# Staged (hedged) dispatch for fallback probing: start the first hosts right
+# away and add one more each time the current best candidate is still pending
+# after the hedge delay.
+_PROBE_INITIAL_BATCH = 2
+_PROBE_HEDGE_DELAY_SECONDS = 0.5
+
+
+class _UnavailableLanguage(NamedTuple):
+    """Cached marker for a host that reported the requested language as missing."""
+
+    available: Tuple[str, ...]
+
+
+_DirectResult = Union[str, None, _UnavailableLanguage]
+
+# Short-lived memo of direct-link lookups keyed by (episode link, host,
+# language) so download retries do not re-scrape hosts probed moments ago.
+# Misses and language-unavailable answers are kept for a shorter time than hits.
+_DIRECT_CACHE_TTL_SECONDS = 300.0
+_DIRECT_CACHE_NEGATIVE_TTL_SECONDS = 30.0
+_DIRECT_CACHE_MAX_ENTRIES = 512
+_DIRECT_CACHE_LOCK = threading.Lock()
+_DIRECT_CACHE: OrderedDict[Tuple[str, str, str], Tuple[float, _DirectResult]] = (
+    OrderedDict()
+)
 
 
 def _parse_available_languages_from_error(msg: str) -> List[str]:
@@ -28,24 +58,94 @@ def _parse_available_languages_from_error(msg: str) -> List[str]:
     Returns:
         List[str]: Ordered list of extracted language names, or an empty list if none found.
     """
-    match = _AVAIL_RE.search(msg or "")
-    if not match:
+    if not msg:
+        return []
+    # Searched case-insensitively on the original text: lowercasing first can
+    # change the string length (e.g. "İ") and misalign the slice offsets.
+    marker = _AVAIL_MARKER_RE.search(msg)
+    if marker is None:
         return []
-    raw = match.group(1)
-    parts = [part.strip(" '\"\t") for part in raw.split(",") if part.strip()]
-    seen = set()
-    out: List[str] = []
-    for part in parts:
-        if part not in seen:
-            seen.add(part)
-            out.append(part)
-    return out
+    start = marker.end()
+    lb = msg.find("[", start)
+    if lb < 0 or msg[start:lb].strip():
+        return []
+    rb = msg.find("]", lb + 1)
+    if rb < 0:
+        return []
+    return list(
+        dict.fromkeys(
+            part.strip(" '\"\t") for part in msg[lb + 1 : rb].split(",") if part.strip()
+        )
+    )
+
+
+def _direct_cache_key(
+    ep: Episode, provider_name: str, language: str
+) -> Optional[Tuple[str, str, str]]:
+    """Return the direct-link cache key for an episode, or None if it has no link."""
+    link = getattr(ep, "link", None)
+    if not isinstance(link, str) or not link:
+        return None
+    return link, provider_name, language
+
+
+def _get_cached_direct(key: Tuple[str, str, str]) -> Tuple[bool, _DirectResult]:
+    """
+    Look up a fresh direct-link cache entry.
+
+    Returns:
+        Tuple[bool, _DirectResult]: `(hit, result)`; `result` is `None` for a cached miss and an `_UnavailableLanguage` marker for a cached language error.
+    """
+    with _DIRECT_CACHE_LOCK:
+        record = _DIRECT_CACHE.get(key)
+        if record is None:
+            return False, None
+        expires_at, url = record
+        if expires_at <= time.monotonic():
+            del _DIRECT_CACHE[key]
+            return False, None
+        _DIRECT_CACHE.move_to_end(key)
+        return True, url
+
+
+def _set_cached_direct(key: Tuple[str, str, str], result: _DirectResult) -> None:
+    """Store a direct-link lookup result, evicting the least recently used entries."""
+    ttl = (
+        _DIRECT_CACHE_TTL_SECONDS
+        if isinstance(result, str)
+        else _DIRECT_CACHE_NEGATIVE_TTL_SECONDS
+    )
+    with _DIRECT_CACHE_LOCK:
+        _DIRECT_CACHE[key] = (time.monotonic() + ttl, result)
+        _DIRECT_CACHE.move_to_end(key)
+        while len(_DIRECT_CACHE) > _DIRECT_CACHE_MAX_ENTRIES:
+            _DIRECT_CACHE.popitem(last=False)
+
+
+def forget_direct_url(ep: Episode, provider_name: str, language: str) -> None:
+    """
+    Drop a memoized direct-link result so the next lookup probes the host again.
+
+    Called when a download from a resolved URL failed, so retries never reuse a dead URL.
+
+    Parameters:
+        ep (Episode): Episode the URL was resolved for.
+        provider_name (str): Video host that supplied the URL.
+        language (str): Language label the URL was resolved for.
+    """
+    key = _direct_cache_key(ep, provider_name, normalize_language(language))
+    if key is None:
+        return
+    with _DIRECT_CACHE_LOCK:
+        _DIRECT_CACHE.pop(key, None)
 
 
 def _try_get_direct(ep: Episode, provider_name: str, language: str) -> Optional[str]:
     """
     Attempt to obtain a direct download URL from a specific provider for a given language.
 
+    Results for episodes that expose a `link` are memoized briefly (hits for 5 minutes, misses and language-unavailable errors for 30 seconds).
+
     Parameters:
         ep (Episode): Episode to query for a direct link.
         provider_name (str): Provider identifier to query.
@@ -58,15 +158,28 @@ def _try_get_direct(ep: Episode, provider_name: str, language: str) -> Optional[
         LanguageUnavailableError: If the provider reports the requested language is not offered; the exception contains the list of available languages.
     """
     language = normalize_language(language)
+    key = _direct_cache_key(ep, provider_name, language)
+    if key is not None:
+        hit, cached = _get_cached_direct(key)
+        if hit:
+            logger.debug(
+                "Using cached direct-link result for provider '{}': {}",
+                provider_name,
+                cached,
+            )
+            if isinstance(cached, _UnavailableLanguage):
+                raise LanguageUnavailableError(language, list(cached.available))
+            return cached
     logger.info("Trying provider '{}' for language '{}'", provider_name, language)
+    url: Optional[str] = None
     try:
-        url = ep.get_direct_link(provider_name, language)  # Lib-API
+        url = ep.get_direct_link(provider_name, language) or None  # Lib-API
         if url:
             logger.success(
                 "Found direct URL from provider '{}': {}", provider_name, url
             )
-            return url
-        logger.warning("Provider '{}' returned no URL.", provider_name)
+        else:
+            logger.warning("Provider '{}' returned no URL.", provider_name)
     except Exception as exc:
         msg = str(exc)
         if "No provider found for language" in msg:
@@ -74,9 +187,31 @@ def _try_get_direct(ep: Episode, provider_name: str, language: str) -> Optional[
             logger.error(
                 "Language '{}' unavailable. Available: {}", language, available
             )
+            if key is not None:
+                _set_cached_direct(key, _UnavailableLanguage(tuple(available)))
             raise LanguageUnavailableError(language, available) from exc
         logger.warning("Exception from provider '{}': {}", provider_name, msg)
-    return None
+    if key is not None:
+        _set_cached_direct(key, url)
+    return url
+
+
+_LANGUAGE_ATTRS = ("language_name", "languages", "available_languages")
+_AUTO_FILL_METHODS = (
+    "auto_fill_details",
+    "_auto_fill_basic_details",
+    "auto_fill_basic_details",
+)
+
+
+def _episode_languages(ep: Episode) -> Optional[object]:
+    """Return the first truthy language attribute, else the last one probed (like an `or` chain)."""
+    value = None
+    for attr in _LANGUAGE_ATTRS:
+        value = getattr(ep, attr, None)
+        if value:
+            break
+    return value
 
 
 def _auto_fill_languages(ep: Episode) -> Optional[object]:
@@ -96,18 +231,10 @@ def _auto_fill_languages(ep: Episode) -> Optional[object]:
         The episode's language value (e.g., a string, list, or other representation) if present,
         or `None` when no language information could be determined.
     """
-    _langs = (
-        getattr(ep, "language_name", None)
-        or getattr(ep, "languages", None)
-        or getattr(ep, "available_languages", None)
-    )
-    if _langs:
-        return _langs
-    for auto_name in (
-        "auto_fill_details",
-        "_auto_fill_basic_details",
-        "auto_fill_basic_details",
-    ):
+    langs = _episode_languages(ep)
+    if langs:
+        return langs
+    for auto_name in _AUTO_FILL_METHODS:
         auto_fn = getattr(ep, auto_name, None)
         if callable(auto_fn):
             try:
@@ -119,11 +246,7 @@ def _auto_fill_languages(ep: Episode) -> Optional[object]:
                     auto_name,
                     err,
                 )
-    return (
-        getattr(ep, "language_name", None)
-        or getattr(ep, "languages", None)
-        or getattr(ep, "available_languages", None)
-    )
+    return _episode_languages(ep)
 
 
 def _validate_language_available(ep: Episode, language: str) -> None:
@@ -156,6 +279,82 @@ def _validate_language_available(ep: Episode, language: str) -> None:
         raise LanguageUnavailableError(language, lang_iter)
 
 
+def _probe_providers(
+    ep: Episode,
+    providers: List[str],
+    language: str,
+    tried: Dict[str, None],
+) -> Optional[Tuple[str, str]]:
+    """
+    Probe video hosts for a direct URL, honouring their priority order.
+
+    With `PROVIDER_PROBE_CONCURRENCY` above 1, probes run on a short-lived thread pool using a staged dispatch: the first hosts start immediately and another one is started whenever the highest-priority pending probe has not finished within the hedge delay. Results are still consumed in priority order, so a lower-priority host never wins over a higher-priority one that succeeds, while failing hosts cost roughly the slowest probe instead of the sum of all probes. Once a URL is found it is returned immediately: probes that have not started are cancelled and ones still in flight finish in the background without starting new work. On the exhausted and error paths the remaining probes are joined before returning.
+
+    Parameters:
+        ep (Episode): Episode to query for a direct link.
+        providers (List[str]): Video host names in priority order.
+        language (str): Normalized language label.
+        tried (Dict[str, None]): Insertion-ordered set collecting the host names that were dispatched.
+
+    Returns:
+        Optional[Tuple[str, str]]: `(direct_url, host_name)` for the highest-priority host that returned a URL, or `None` if none did.
+
+    Raises:
+        LanguageUnavailableError: If a host reports the language is unavailable before a higher-priority host returned a URL.
+    """
+    if not providers:
+        return None
+
+    workers = min(PROVIDER_PROBE_CONCURRENCY, len(providers))
+    if workers <= 1:
+        for provider in providers:
+            tried[provider] = None
+            url = _try_get_direct(ep, provider, language)
+            if url:
+                return url, provider
+        return None
+
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="provider-probe"
+    )
+    futures: List[Future[Optional[str]]] = []
+    stop = threading.Event()
+
+    def _probe(provider: str) -> Optional[str]:
+        # A probe that a worker picks up after the outcome is known is skipped.
+        if stop.is_set():
+            return None
+        return _try_get_direct(ep, provider, language)
+
+    def _submit_next() -> None:
+        if len(futures) < len(providers):
+            provider = providers[len(futures)]
+            tried[provider] = None
+            futures.append(executor.submit(_probe, provider))
+
+    winner_found = False
+    try:
+        for _ in range(_PROBE_INITIAL_BATCH):
+            _submit_next()
+        for index, provider in enumerate(providers):
+            if index >= len(futures):
+                _submit_next()
+            future = futures[index]
+            while not wait([future], timeout=_PROBE_HEDGE_DELAY_SECONDS).done:
+                _submit_next()
+            url = future.result()
+            if url:
+                winner_found = True
+                return url, provider
+        return None
+    finally:
+        # Queued probes are dropped either way. A winner is handed back without
+        # waiting on slower siblings (the stop flag keeps them from starting new
+        # work); otherwise the in-flight probes are joined.
+        stop.set()
+        executor.shutdown(wait=not winner_found, cancel_futures=True)
+
+
 def get_direct_url_with_fallback(
     ep: Episode,
     *,
@@ -186,12 +385,12 @@ def get_direct_url_with_fallback(
 
     _validate_language_available(ep, language)
 
-    tried: List[str] = []
+    tried: Dict[str, None] = {}
 
     if preferred:
         pref = preferred.strip()
         if pref:
-            tried.append(pref)
+            tried[pref] = None
             try:
                 url = _try_get_direct(ep, pref, language)
             except LanguageUnavailableError:
@@ -200,17 +399,11 @@ def get_direct_url_with_fallback(
                 logger.success("Using preferred provider '{}'", pref)
                 return url, pref
 
-    for provider in PROVIDER_ORDER:
-        if provider in tried:
-            continue
-        tried.append(provider)
-        try:
-            url = _try_get_direct(ep, provider, language)
-        except LanguageUnavailableError:
-            raise
-        if url:
-            logger.success("Using fallback provider '{}'", provider)
-            return url, provider
+    remaining = [provider for provider in PROVIDER_ORDER if provider not in tried]
+    found = _probe_providers(ep, remaining, language, tried)
+    if found:
+        logger.success("Using fallback provider '{}'", found[1])
+        return found
 
     logger.error(
         "No direct link found. Tried providers: {}", ", ".join(tried) or "none"
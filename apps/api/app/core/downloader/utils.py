@@ -1,13 +1,15 @@
 import re
+from functools import lru_cache
 
-from loguru import logger
+_RESERVED_CHARS_RE = re.compile(r"[\\/:*?\"<>|]+")
 
 
+@lru_cache(maxsize=256)
 def sanitize_filename(name: str) -> str:
     """
     Sanitize a filename by replacing filesystem-reserved characters with underscores and trimming whitespace.
 
-    Replaces any occurrence of the characters \\ / : * ? " < > | with an underscore, then strips leading and trailing whitespace.
+    Replaces any run of the characters \\ / : * ? " < > | with a single underscore, then strips leading and trailing whitespace.
 
     Parameters:
         name (str): Original filename to sanitize.
@@ -15,7 +17,4 @@ def sanitize_filename(name: str) -> str:
     Returns:
         str: The sanitized filename with reserved characters replaced by underscores and surrounding whitespace removed.
     """
-    logger.debug("Sanitizing filename: {}", name)
-    sanitized = re.sub(r"[\\/:*?\"<>|]+", "_", name).strip()
-    logger.debug("Sanitized filename: {}", sanitized)
-    return sanitized
+    return _RESERVED_CHARS_RE.sub("_", name).strip()
@@ -1,17 +1,67 @@
+import shutil
+from http.cookiejar import MozillaCookieJar
 import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 from urllib.parse import urlsplit
 
-import yt_dlp
+import requests
 from loguru import logger
-from yt_dlp.utils import DownloadError as YTDLPDownloadError
 
-from app.config import DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC
+from app.config import (
+    DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC,
+    YTDLP_ARIA2C_ENABLED,
+    YTDLP_CONCURRENT_FRAGMENTS,
+)
 from .errors import DownloadError
 from .utils import sanitize_filename
 from .types import ProgressCb
 
+if TYPE_CHECKING:
+    import yt_dlp
+
+# yt-dlp reports progress per network chunk; intermediate "downloading" ticks
+# are coalesced to at most one callback per interval.
+_PROGRESS_MIN_INTERVAL_SECONDS = 0.1
+
+_HTTP_CHUNK_SIZE_BYTES = 10 * 1024 * 1024
+
+# Pre-flight HEAD check for progressive URLs: expired CDN links fail here in
+# one round trip instead of after yt-dlp setup and its socket timeout.
+_PROBE_TIMEOUT_SECONDS = 5
+# Only statuses that mean the resource is gone count as dead. CDNs often
+# answer 401/403/429 (or reject HEAD) for requests yt-dlp would still get
+# through, so every other status is inconclusive and yt-dlp gets to try.
+_PROBE_DEAD_STATUSES = frozenset({404, 410})
+
+# Static yt-dlp options shared by every download; per-call keys (output
+# template, fragment concurrency, hooks, limits) are layered onto a copy.
+_YDL_BASE_OPTS: Dict[str, Any] = {
+    "retries": 3,
+    "fragment_retries": 3,
+    "continuedl": True,
+    "quiet": True,
+    "noprogress": True,
+    "merge_output_format": "mkv",
+    "downloader": "ffmpeg",
+    "hls_use_mpegts": True,
+    "socket_timeout": 20,
+}
+
+# Resolved once: aria2c is only used when opted in and installed.
+_ARIA2C_PATH = shutil.which("aria2c") if YTDLP_ARIA2C_ENABLED else None
+_ARIA2C_ARGS = [
+    "-x",
+    "8",
+    "-s",
+    "8",
+    "-k",
+    "1M",
+    "--summary-interval=0",
+    "--console-log-level=warn",
+]
+
 
 def _looks_like_hls_url(url: str) -> bool:
     """Return True when `url` appears to target an HLS playlist."""
@@ -22,6 +72,61 @@ def _looks_like_hls_url(url: str) -> bool:
     return path.endswith(".m3u8") or ".m3u8" in path
 
 
+def _probe_request_kwargs(cookiefile: Optional[Path]) -> Dict[str, Any]:
+    """Build the headers and cookies yt-dlp would send for a direct URL."""
+    from yt_dlp.utils.networking import std_headers
+
+    kwargs: Dict[str, Any] = {"headers": dict(std_headers)}
+    if cookiefile:
+        jar = MozillaCookieJar(str(cookiefile))
+        try:
+            jar.load(ignore_discard=True, ignore_expires=True)
+        except (OSError, ValueError) as exc:
+            logger.debug("Pre-flight could not load cookiefile {}: {}", cookiefile, exc)
+        else:
+            kwargs["cookies"] = jar
+    return kwargs
+
+
+def _probe_url(url: str, *, cookiefile: Optional[Path] = None) -> Optional[str]:
+    """
+    HEAD a progressive direct URL and report why it is dead, if it is.
+
+    The request carries yt-dlp's standard headers and the cookies from `cookiefile`, so the CDN sees the same client it will serve. Only 404/410 responses and connection failures count as dead; timeouts and every other status are inconclusive. Proxy settings follow the environment, as they do for yt-dlp.
+
+    Returns:
+        Optional[str]: A short failure reason when the URL is dead, otherwise `None`.
+    """
+    try:
+        resp = requests.head(
+            url,
+            timeout=_PROBE_TIMEOUT_SECONDS,
+            allow_redirects=True,
+            **_probe_request_kwargs(cookiefile),
+        )
+    except requests.Timeout as exc:
+        logger.debug("Direct URL pre-flight inconclusive for {}: {}", url, exc)
+        return None
+    except requests.ConnectionError as exc:
+        logger.warning("Direct URL pre-flight could not connect: url={} ({})", url, exc)
+        return "connection failed"
+    except requests.RequestException as exc:
+        logger.debug("Direct URL pre-flight inconclusive for {}: {}", url, exc)
+        return None
+    try:
+        status = resp.status_code
+    finally:
+        resp.close()
+    if status in _PROBE_DEAD_STATUSES:
+        logger.warning("Direct URL pre-flight failed: status={} url={}", status, url)
+        return f"HTTP {status}"
+    if status >= 400:
+        logger.debug(
+            "Direct URL pre-flight inconclusive: status={} url={}", status, url
+        )
+    return None
+
+
 def _ydl_download(
     direct_url: str,
     dest_dir: Path,
@@ -45,7 +150,7 @@ def _ydl_download(
         Tuple[Path, Dict[str, Any]]: The final downloaded file path and the yt-dlp info dictionary.
 
     Raises:
-        DownloadError: On cancellation, timeout, yt-dlp failures, or other unexpected download errors.
+        DownloadError: On cancellation, timeout, yt-dlp failures, a progressive URL whose HEAD pre-flight shows it is gone, or other unexpected download errors.
     """
     logger.info(
         "Starting yt-dlp download: url={}, dest_dir={}, title_hint={}",
@@ -53,29 +158,30 @@ def _ydl_download(
         dest_dir,
         title_hint,
     )
+    is_hls = _looks_like_hls_url(direct_url)
+    # HLS playlists are skipped: some CDNs answer HEAD on them with odd
+    # redirects or content types even though GET works.
+    if not is_hls:
+        dead_reason = _probe_url(direct_url, cookiefile=cookiefile)
+        if dead_reason:
+            raise DownloadError(f"dead url ({dead_reason})")
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     outtmpl = str(
         dest_dir / (sanitize_filename(title_hint or "%(title)s") + ".%(ext)s")
     )
     logger.debug("yt-dlp output template: {}", outtmpl)
-    concurrent_fragment_downloads = 4
-    ydl_opts: Dict[str, Any] = {
-        "outtmpl": outtmpl,
-        "retries": 3,
-        "fragment_retries": 3,
-        "continuedl": True,
-        "concurrent_fragment_downloads": concurrent_fragment_downloads,
-        "quiet": True,
-        "noprogress": True,
-        "merge_output_format": "mkv",
-        "downloader": "ffmpeg",
-        "hls_use_mpegts": True,
-        "socket_timeout": 20,
-    }
+    concurrent_fragment_downloads = YTDLP_CONCURRENT_FRAGMENTS
+    ydl_opts: Dict[str, Any] = _YDL_BASE_OPTS.copy()
+    ydl_opts["outtmpl"] = outtmpl
+    ydl_opts["concurrent_fragment_downloads"] = concurrent_fragment_downloads
+    if not is_hls:
+        # Chunked range requests keep single-file downloads moving on hosts
+        # that throttle long-lived connections.
+        ydl_opts["http_chunk_size"] = _HTTP_CHUNK_SIZE_BYTES
     if DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC > 0:
         effective_ratelimit = DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC
-        if concurrent_fragment_downloads > 1 and _looks_like_hls_url(direct_url):
+        if concurrent_fragment_downloads > 1 and is_hls:
             # yt-dlp applies ratelimit per concurrent fragment stream.
             effective_ratelimit = max(
                 1, DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC // concurrent_fragment_downloads
@@ -95,6 +201,16 @@ def _ydl_download(
             effective_ratelimit,
         )
 
+    if _ARIA2C_PATH and DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC <= 0 and not is_hls:
+        # HLS keeps yt-dlp's native fragment downloader for MPEG-TS muxing.
+        ydl_opts["external_downloader"] = {"http": _ARIA2C_PATH, "https": _ARIA2C_PATH}
+        ydl_opts["external_downloader_args"] = {"aria2c": list(_ARIA2C_ARGS)}
+        logger.info("Using aria2c for progressive download: {}", _ARIA2C_PATH)
+
+    # Bound once: the hook fires on every progress tick of every fragment.
+    stop_requested = stop_event.is_set if stop_event is not None else None
+    last_forwarded = float("-inf")
+
     def _compound_hook(progress: dict) -> None:
         """
         Handle a single yt-dlp progress update: enforce cancellation and forward the progress to the provided callback.
@@ -106,12 +222,19 @@ def _ydl_download(
             DownloadError: If a stop event has been set indicating the download should be cancelled.
 
         Notes:
+            "downloading" updates are forwarded at most every `_PROGRESS_MIN_INTERVAL_SECONDS`; other statuses (e.g. "finished", "error") are always forwarded.
             If the progress callback raises an exception, it will be caught and suppressed.
         """
-        if stop_event is not None and stop_event.is_set():
+        nonlocal last_forwarded
+        if stop_requested is not None and stop_requested():
             logger.warning("Download cancelled by stop_event.")
             raise DownloadError("Cancelled")
         if progress_cb:
+            if progress.get("status") == "downloading":
+                now = time.monotonic()
+                if now - last_forwarded < _PROGRESS_MIN_INTERVAL_SECONDS:
+                    return
+                last_forwarded = now
             try:
                 progress_cb(progress)
             except Exception as exc:
@@ -123,6 +246,11 @@ def _ydl_download(
         logger.info("Using cookiefile: {}", cookiefile)
         ydl_opts["cookiefile"] = str(cookiefile)
 
+    # Imported here rather than at module level: yt-dlp pulls in hundreds of
+    # extractor modules, so it is only loaded once a download actually runs.
+    import yt_dlp
+    from yt_dlp.utils import DownloadError as YTDLPDownloadError
+
     try:
         ydl_params = cast("yt_dlp.YoutubeDL.Params", ydl_opts)  # type: ignore[arg-type]
         with yt_dlp.YoutubeDL(ydl_params) as ydl:
@@ -24,12 +24,9 @@ def resolve_direct_url(identity: StrmIdentity) -> tuple[str, str | None]:
     if "megakino" in site and slug:
         client = get_default_client()
         preferred = identity.provider or None
-        provider_candidates: list[str | None] = []
-        if preferred:
-            provider_candidates.append(preferred)
-        for prov_name in PROVIDER_ORDER:
-            if prov_name not in provider_candidates:
-                provider_candidates.append(prov_name)
+        provider_candidates: list[str | None] = list(
+            dict.fromkeys([preferred, *PROVIDER_ORDER] if preferred else PROVIDER_ORDER)
+        )
         if not provider_candidates:
             provider_candidates = [None]
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import threading
 from typing import Optional
 
@@ -13,26 +14,18 @@ configure_logger()
 
 
 # Kept for safe logging in system reports where URLs may embed credentials.
+# Matches "scheme://user[:password]@" so the password can be replaced in a
+# single pass without a urlsplit/urlunsplit round-trip.
+_URL_USERINFO_RE = re.compile(
+    r"^(?P<prefix>[A-Za-z][A-Za-z0-9+.\-]*://)(?P<user>[^/?#@:]*)(?::[^/?#@]*)?@"
+)
+
+
 def _mask(url: str | None) -> str:
     """Mask credentials in a URL for safe logging."""
     if not url:
         return ""
-    try:
-        from urllib.parse import urlsplit, urlunsplit
-
-        p = urlsplit(url)
-        netloc = p.netloc
-        if "@" in netloc:
-            userinfo, host = netloc.split("@", 1)
-            if ":" in userinfo:
-                user, _ = userinfo.split(":", 1)
-            else:
-                user = userinfo
-            netloc = f"{user}:****@{host}"
-        p2 = (p.scheme, netloc, p.path or "", p.query or "", p.fragment or "")
-        return urlunsplit(p2)
-    except Exception:
-        return url
+    return _URL_USERINFO_RE.sub(r"\g<prefix>\g<user>:****@", url, count=1)
 
 
 def _fetch_public_ip() -> Optional[str]:
@@ -211,10 +211,11 @@ class CatalogProvider:
             return {}, {}
         path = self.alphabet_html
         logger.info("Loading index from file: {} for site: {}", path, self.key)
-        if not path.exists():
+        try:
+            html_text = path.read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
             logger.warning("Configured HTML file does not exist: {}", path)
             return {}, {}
-        html_text = path.read_text(encoding="utf-8", errors="replace")
         return self.parse_index_and_alts(html_text)
 
     def load_or_refresh_index(self) -> Dict[str, str]:
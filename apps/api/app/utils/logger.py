@@ -8,15 +8,30 @@ from typing import Optional
 import logging
 
 _STDLIB_LOGGING_CONFIGURED = False
+# Handler id and (LOG_LEVEL, stream) of the stdout sink installed by config().
+# Most modules call config() at import time; the sink is only rebuilt when it
+# was removed by someone else or its level/stream changed.
+_STDOUT_SINK_ID: Optional[int] = None
+_STDOUT_SINK_KEY: Optional[tuple[str, object]] = None
+
+
+def _sink_registered(handler_id: Optional[int]) -> bool:
+    """Return whether `handler_id` is still an installed Loguru handler."""
+    if handler_id is None:
+        return False
+    # Loguru has no public handler listing; fall back to "not registered"
+    # (i.e. re-install) should its internals ever change.
+    handlers = getattr(getattr(logger, "_core", None), "handlers", None)
+    return isinstance(handlers, dict) and handler_id in handlers
 
 
 def config():
     """
     Configure the global Loguru logger and integrate Python's standard logging into Loguru.
 
-    Reads the LOG_LEVEL environment variable (defaults to "INFO"), ensures a TRACE level exists for Loguru when requested, installs a stdout sink with a structured timestamped format and colorization, and — on first invocation — registers an intercepting standard-library logging handler that redirects stdlib and selected third-party logger output into Loguru (including registering TRACE as numeric level for the stdlib when used). This function is safe to call multiple times; stdlib integration is performed only once.
+    Reads the LOG_LEVEL environment variable (defaults to "INFO"), ensures a TRACE level exists for Loguru when requested, installs a stdout sink with a structured timestamped format and colorization, and — on first invocation — registers an intercepting standard-library logging handler that redirects stdlib and selected third-party logger output into Loguru (including registering TRACE as numeric level for the stdlib when used). This function is safe to call multiple times; stdlib integration is performed only once, and the stdout sink is only re-created when it is no longer registered or LOG_LEVEL or sys.stdout changed (e.g. after the terminal tee is installed).
     """
-    global _STDLIB_LOGGING_CONFIGURED
+    global _STDLIB_LOGGING_CONFIGURED, _STDOUT_SINK_ID, _STDOUT_SINK_KEY
     try:
         logger.level("TRACE")
     except ValueError:
@@ -27,14 +42,17 @@ def config():
         # Register TRACE with stdlib logging and map to numeric level 5.
         logging.addLevelName(5, "TRACE")
         stdlib_level = 5
-    logger.remove()
-    logger.add(
-        sys.stdout,
-        level=LOG_LEVEL,
-        colorize=True,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    )
+    sink_key = (LOG_LEVEL, sys.stdout)
+    if _STDOUT_SINK_KEY != sink_key or not _sink_registered(_STDOUT_SINK_ID):
+        logger.remove()
+        _STDOUT_SINK_ID = logger.add(
+            sys.stdout,
+            level=LOG_LEVEL,
+            colorize=True,
+            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        )
+        _STDOUT_SINK_KEY = sink_key
     if not _STDLIB_LOGGING_CONFIGURED:
 
         class _InterceptHandler(logging.Handler):
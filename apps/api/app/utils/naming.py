@@ -28,10 +28,10 @@ LANG_TAG_MAP = {
 
 
 def _safe_component(s: str) -> str:
-    logger.debug(f"Sanitizing component: {s}")
+    logger.debug("Sanitizing component: {}", s)
     s = re.sub(r"[^A-Za-z0-9]+", ".", s.strip())
     s = re.sub(r"\.+", ".", s).strip(".")
-    logger.debug(f"Sanitized component: {s}")
+    logger.debug("Sanitized component: {}", s)
     return s
 
 
@@ -42,7 +42,7 @@ def _series_component(display_title: str) -> str:
     Returns:
         component (str): Sanitized string suitable for use as the series part of a release filename.
     """
-    logger.debug(f"Building series component from display_title: {display_title}")
+    logger.debug("Building series component from display_title: {}", display_title)
     return _safe_component(display_title)
 
 
@@ -69,7 +69,7 @@ def _map_codec_name(vcodec: Optional[str]) -> str:
     Returns:
         str: One of "H265", "AV1", "VP9", or "H264". Returns "H264" when `vcodec` is None/empty or no known codec match is found.
     """
-    logger.debug(f"Mapping codec name: {vcodec}")
+    logger.debug("Mapping codec name: {}", vcodec)
     if not vcodec:
         return "H264"
     v = vcodec.lower()
@@ -83,7 +83,7 @@ def _map_codec_name(vcodec: Optional[str]) -> str:
 
 
 def _map_height_to_quality(height: Optional[int]) -> str:
-    logger.debug(f"Mapping height to quality: {height}")
+    logger.debug("Mapping height to quality: {}", height)
     if not height:
         return "SD"
     if height >= 2160:
@@ -100,7 +100,7 @@ def _map_height_to_quality(height: Optional[int]) -> str:
 
 
 def _probe_with_ffprobe(path: Path) -> Tuple[Optional[int], Optional[str]]:
-    logger.info(f"Probing file with ffprobe: {path}")
+    logger.info("Probing file with ffprobe: {}", path)
     try:
         args = [
             "ffprobe",
@@ -118,20 +118,20 @@ def _probe_with_ffprobe(path: Path) -> Tuple[Optional[int], Optional[str]]:
         data = json.loads(res.stdout or "{}")
         streams = data.get("streams") or []
         if not streams:
-            logger.warning(f"No streams found in ffprobe output for {path}")
+            logger.warning("No streams found in ffprobe output for {}", path)
             return (None, None)
         st = streams[0]
         height = st.get("height")
         vcodec = st.get("codec_name")
-        logger.debug(f"ffprobe result: height={height}, vcodec={vcodec}")
+        logger.debug("ffprobe result: height={}, vcodec={}", height, vcodec)
         return (int(height) if height else None, str(vcodec) if vcodec else None)
     except Exception as e:
-        logger.error(f"ffprobe failed for {path}: {e}")
+        logger.error("ffprobe failed for {}: {}", path, e)
         return (None, None)
 
 
 def quality_from_info(info: Dict[str, Any]) -> Tuple[Optional[int], Optional[str]]:
-    logger.debug(f"Extracting quality from info dict: {info}")
+    logger.debug("Extracting quality from info dict: {}", info)
     height = None
     vcodec = None
 
@@ -159,7 +159,7 @@ def quality_from_info(info: Dict[str, Any]) -> Tuple[Optional[int], Optional[str
             height = height or best.get("height")
             vcodec = vcodec or best.get("vcodec")
 
-    logger.debug(f"Extracted: height={height}, vcodec={vcodec}")
+    logger.debug("Extracted: height={}, vcodec={}", height, vcodec)
     return (int(height) if height else None, str(vcodec) if vcodec else None)
 
 
@@ -193,7 +193,14 @@ def build_release_name(
         str: The constructed release name string.
     """
     logger.info(
-        f"Building release name for series_title={series_title}, season={season}, episode={episode}, height={height}, vcodec={vcodec}, language={language}, site={site}"
+        "Building release name for series_title={}, season={}, episode={}, height={}, vcodec={}, language={}, site={}",
+        series_title,
+        season,
+        episode,
+        height,
+        vcodec,
+        language,
+        site,
     )
 
     # Use site-specific release group if available
@@ -207,7 +214,9 @@ def build_release_name(
                 "release_group", release_group
             )
         except Exception as e:
-            logger.debug(f"Error accessing CATALOG_SITE_CONFIGS for site {site}: {e}")
+            logger.debug(
+                "Error accessing CATALOG_SITE_CONFIGS for site {}: {}", site, e
+            )
 
     series_part = _series_component(series_title)
     se_part = (
@@ -236,7 +245,7 @@ def build_release_name(
     group = release_group.strip()
     if group:
         base = f"{base}-{group.upper()}"
-    logger.success(f"Release name built: {base}")
+    logger.success("Release name built: {}", base)
     return base
 
 
@@ -273,7 +282,7 @@ def rename_to_release(
     Side effects:
         Renames the file on disk to the generated release-style filename.
     """
-    logger.info(f"Renaming file to release schema: {path} (site: {site})")
+    logger.info("Renaming file to release schema: {} (site: {})", path, site)
     override = (release_name_override or "").strip()
     if override:
         release = _sanitize_release_name(override)
@@ -289,10 +298,10 @@ def rename_to_release(
                 new_path = path.with_name(f"{base}.{i}{suffix}")
                 i += 1
         if new_path != path:
-            logger.info(f"Renaming {path} to {new_path}")
+            logger.info("Renaming {} to {}", path, new_path)
             path.rename(new_path)
         else:
-            logger.info(f"No rename needed for {path}")
+            logger.info("No rename needed for {}", path)
         return new_path
     # 1) Serien-Titel bestimmen
     display_title = None
@@ -332,8 +341,8 @@ def rename_to_release(
             i += 1
 
     if new_path != path:
-        logger.info(f"Renaming {path} to {new_path}")
+        logger.info("Renaming {} to {}", path, new_path)
         path.rename(new_path)
     else:
-        logger.info(f"No rename needed for {path}")
+        logger.info("No rename needed for {}", path)
     return new_path
@@ -2,7 +2,6 @@ from __future__ import annotations
 from typing import Optional, Dict, Any, cast
 import warnings
 from loguru import logger
-import yt_dlp
 
 from app.core.downloader import get_direct_url_with_fallback, build_episode
 from app.utils.naming import quality_from_info
@@ -26,27 +25,30 @@ def probe_episode_quality_once(
         tuple: A three-item tuple (height, vcodec, info_dict) where `height` is the reported video height in pixels or `None` if unavailable, `vcodec` is the reported video codec string or `None` if unavailable, and `info_dict` is the extracted metadata dictionary from yt-dlp or `None` if extraction failed.
     """
     logger.debug(
-        f"Probing episode quality for URL: {direct_url} with timeout={timeout}"
+        "Probing episode quality for URL: {} with timeout={}", direct_url, timeout
     )
     ydl_opts: Dict[str, Any] = {
         "quiet": True,
         "noprogress": True,
         "socket_timeout": timeout,
     }
+    # Imported lazily so Torznab/API startup does not pay for yt-dlp's extractors.
+    import yt_dlp
+
     try:
         with yt_dlp.YoutubeDL(cast(Any, ydl_opts)) as ydl:
             info = ydl.extract_info(direct_url, download=False)
-            logger.debug(f"yt_dlp.extract_info returned: {info}")
+            logger.debug("yt_dlp.extract_info returned: {}", info)
         if not info:
             logger.warning("No info extracted from the URL.")
             return (None, None, None)
         # yt_dlp returns a specialized _InfoDict; cast to plain Dict for type checkers
         info_dict = cast(Dict[str, Any], info)
         h, vc = quality_from_info(info_dict)
-        logger.info(f"Extracted quality: height={h}, vcodec={vc}")
+        logger.info("Extracted quality: height={}, vcodec={}", h, vc)
         return (h, vc, info_dict)
     except Exception as e:
-        logger.warning(f"Preflight probe failed for URL {direct_url}: {e}")
+        logger.warning("Preflight probe failed for URL {}: {}", direct_url, e)
         return (None, None, None)
 
 
@@ -91,8 +93,15 @@ def probe_episode_quality(
         preferred_host = preferred_provider
 
     logger.info(
-        f"Probing episode quality for slug={slug}, season={season}, episode={episode}, language={language}, "
-        f"preferred_host={preferred_host}, timeout={timeout}, site={site}"
+        "Probing episode quality for slug={}, season={}, episode={}, language={}, "
+        "preferred_host={}, timeout={}, site={}",
+        slug,
+        season,
+        episode,
+        language,
+        preferred_host,
+        timeout,
+        site,
     )
     if "megakino" in site:
         try:
@@ -117,10 +126,10 @@ def probe_episode_quality(
         return (available, h, vc, provider_used, info)
 
     if site not in CATALOG_SITE_CONFIGS:
-        logger.warning(f"Unknown site '{site}', defaulting to aniworld.to")
+        logger.warning("Unknown site '{}', defaulting to aniworld.to", site)
         site = "aniworld.to"
     ep = build_episode(slug=slug, season=season, episode=episode, site=site)
-    logger.debug(f"Built episode object: {ep}")
+    logger.debug("Built episode object: {}", ep)
     # get_direct_url_with_fallback already tries the preferred host and every
     # configured fallback. Wrapping it in another host loop made failures run
     # through the same providers repeatedly until Sonarr timed out.
@@ -128,10 +137,13 @@ def probe_episode_quality(
         direct, chosen = get_direct_url_with_fallback(
             ep, preferred=preferred_host, language=language
         )
-        logger.debug(f"Got direct URL: {direct} (chosen host: {chosen})")
+        logger.debug("Got direct URL: {} (chosen host: {})", direct, chosen)
         h, vc, info = probe_episode_quality_once(direct, timeout=timeout)
         logger.info(
-            f"Host '{chosen}' succeeded: available=True, height={h}, vcodec={vc}"
+            "Host '{}' succeeded: available=True, height={}, vcodec={}",
+            chosen,
+            h,
+            vc,
         )
         return (True, h, vc, chosen, info)
     except Exception as exc:
@@ -342,13 +342,13 @@ def _load_index_from_file(
         - If reading or parsing fails, the exception is logged and re-raised.
     """
     logger.info(f"Loading index from file: {path} for site: {site}")
-    if not path.exists():
-        logger.warning(f"Configured HTML file does not exist: {path}")
-        return {}, {}
     try:
         html_text = path.read_text(encoding="utf-8", errors="ignore")
         logger.success(f"Successfully read file: {path} for site: {site}")
         return _parse_index_and_alts(html_text, site)
+    except FileNotFoundError:
+        logger.warning(f"Configured HTML file does not exist: {path}")
+        return {}, {}
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Failed to read file {path} for {site}: {e}")
         raise
@@ -30,6 +30,23 @@ def test_provider_order_normalizes_case_and_drops_invalid(monkeypatch):
     assert cfg.PROVIDER_ORDER == ["VOE", "Filemoon", "GXPlayer"]
 
 
+def test_provider_order_and_catalog_sites_drop_duplicates(monkeypatch):
+    monkeypatch.setenv("PROVIDER_ORDER", "VOE,Filemoon,voe,VOE ,Filemoon")
+    monkeypatch.setenv("CATALOG_SITES", "s.to, aniworld.to,s.to,,aniworld.to")
+    import importlib
+    import sys
+    import app
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert cfg.PROVIDER_ORDER == ["VOE", "Filemoon"]
+    assert cfg.CATALOG_SITES_LIST == ["s.to", "aniworld.to"]
+
+
 def test_repo_root_defaults_anchor_local_data_paths() -> None:
     import app.config as cfg
 
@@ -121,3 +138,249 @@ def test_provider_redirect_settings(monkeypatch):
     cfg = importlib.import_module("app.config")
     cfg = importlib.reload(cfg)
     assert cfg.DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC == 0
+
+
+def test_directories_resolved_lazily(monkeypatch, tmp_path):
+    data_dir = tmp_path / "lazy-data"
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
+    import importlib
+    import app
+    import sys
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert "DATA_DIR" not in vars(cfg)
+    assert not data_dir.exists()
+
+    assert cfg.DATA_DIR == data_dir.resolve()
+    assert data_dir.is_dir()
+    assert "DATA_DIR" in vars(cfg)
+
+
+def test_ensure_dir_skips_mkdir_for_existing_directory(monkeypatch, tmp_path):
+    from pathlib import Path
+
+    import app.config as cfg
+
+    def _fail_mkdir(self, *args, **kwargs):
+        raise AssertionError("mkdir must not be called for existing directories")
+
+    monkeypatch.setattr(Path, "mkdir", _fail_mkdir)
+
+    assert cfg._ensure_dir([tmp_path], "DATA_DIR") == tmp_path.resolve()
+
+
+def test_load_dotenv_once_is_guarded_in_process(monkeypatch):
+    import os
+
+    import app.config as cfg
+
+    calls = []
+    monkeypatch.setattr(cfg, "load_dotenv", lambda **kwargs: calls.append(kwargs))
+    cfg.load_dotenv_once.cache_clear()
+    try:
+        cfg.load_dotenv_once()
+        cfg.load_dotenv_once()
+    finally:
+        cfg.load_dotenv_once.cache_clear()
+
+    assert calls == [{"override": False}]
+    # Nothing leaks into the environment inherited by child processes.
+    assert "_ANIBRIDGE_DOTENV_LOADED" not in os.environ
+
+
+def test_in_docker_env_override_skips_dockerenv_probe(monkeypatch):
+    import importlib
+    import sys
+    from pathlib import Path
+
+    import app
+
+    probed: list[str] = []
+    original_exists = Path.exists
+
+    def _tracking_exists(self, *args, **kwargs):
+        probed.append(str(self))
+        return original_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", _tracking_exists)
+
+    for value, expected in (("1", True), ("false", False)):
+        monkeypatch.setenv("ANIBRIDGE_IN_DOCKER", value)
+        probed.clear()
+        if "app.config" in sys.modules:
+            del sys.modules["app.config"]
+        if hasattr(app, "config"):
+            delattr(app, "config")
+        cfg = importlib.import_module("app.config")
+
+        assert cfg.IN_DOCKER is expected
+        assert "/.dockerenv" not in probed
+
+
+def test_strm_proxy_mode_redirect_falls_back_to_proxy(monkeypatch):
+    monkeypatch.setenv("STRM_PROXY_MODE", "Redirect")
+    monkeypatch.setenv("STRM_PUBLIC_BASE_URL", "http://anibridge.local:8000")
+    monkeypatch.setenv("STRM_PROXY_AUTH", "none")
+    import importlib
+    import sys
+    import app
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert cfg.STRM_PROXY_MODE == "proxy"
+    assert cfg.STRM_PROXY_ENABLED is True
+
+
+def test_ensure_dir_skips_existing_read_only_directory(monkeypatch, tmp_path):
+    import app.config as cfg
+
+    read_only = tmp_path / "read-only"
+    writable = tmp_path / "writable"
+    read_only.mkdir()
+
+    monkeypatch.setattr(
+        cfg.os, "access", lambda path, mode: str(path) != str(read_only)
+    )
+
+    assert cfg._ensure_dir([read_only, writable], "DATA_DIR") == writable.resolve()
+    assert writable.is_dir()
+
+
+def test_alphabet_html_override_does_not_resolve_data_dir(monkeypatch, tmp_path):
+    from pathlib import Path
+
+    override = tmp_path / "alphabet.html"
+    monkeypatch.setenv("ANIWORLD_ALPHABET_HTML", str(override))
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "unused-data"))
+    import importlib
+    import app
+    import sys
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert cfg.ANIWORLD_ALPHABET_HTML == Path(override)
+    assert "DATA_DIR" not in vars(cfg)
+
+
+def test_qbit_public_save_path_is_normalized_without_resolving_symlinks(
+    monkeypatch, tmp_path
+):
+    target = tmp_path / "target"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    monkeypatch.setenv("QBIT_PUBLIC_SAVE_PATH", f"{link}/sub/../downloads")
+    import importlib
+    import app
+    import sys
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert cfg.QBIT_PUBLIC_SAVE_PATH == str(link / "downloads")
+
+
+def test_numeric_settings_fall_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("STRM_PROXY_TOKEN_TTL_SECONDS", "-5")
+    monkeypatch.setenv("STRM_PROXY_CACHE_TTL_SECONDS", "soon")
+    monkeypatch.setenv("SPECIALS_METADATA_TIMEOUT_SECONDS", "abc")
+    monkeypatch.setenv("SPECIALS_METADATA_CACHE_TTL_MINUTES", "-1")
+    monkeypatch.setenv("SPECIALS_MATCH_CONFIDENCE_THRESHOLD", "1.7")
+    import importlib
+    import app
+    import sys
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert cfg.STRM_PROXY_TOKEN_TTL_SECONDS == 900
+    assert cfg.STRM_PROXY_CACHE_TTL_SECONDS == 0
+    assert cfg.SPECIALS_METADATA_TIMEOUT_SECONDS == 8.0
+    assert cfg.SPECIALS_METADATA_CACHE_TTL_MINUTES == 0
+    assert cfg.SPECIALS_MATCH_CONFIDENCE_THRESHOLD == 1.0
+
+
+def test_site_configs_only_built_for_enabled_sites(monkeypatch, tmp_path):
+    monkeypatch.setenv("CATALOG_SITES", "megakino")
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "unused-data"))
+    import importlib
+    import app
+    import sys
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    cfg = importlib.import_module("app.config")
+
+    assert list(cfg.CATALOG_SITE_CONFIGS) == ["megakino"]
+    assert cfg.CATALOG_SITE_CONFIGS["megakino"]["default_languages"] == [
+        "Deutsch",
+        "German Dub",
+    ]
+    assert "DATA_DIR" not in vars(cfg)
+
+
+def test_strm_proxy_mode_requires_secret_when_auth_enabled(monkeypatch):
+    import importlib
+    import sys
+
+    import pytest
+
+    import app
+
+    monkeypatch.setenv("STRM_PROXY_MODE", "proxy")
+    monkeypatch.setenv("STRM_PUBLIC_BASE_URL", "http://anibridge.local:8000")
+    monkeypatch.setenv("STRM_PROXY_AUTH", "token")
+    monkeypatch.delenv("STRM_PROXY_SECRET", raising=False)
+
+    if "app.config" in sys.modules:
+        del sys.modules["app.config"]
+    if hasattr(app, "config"):
+        delattr(app, "config")
+    with pytest.raises(RuntimeError, match="STRM_PROXY_SECRET is required"):
+        importlib.import_module("app.config")
+    sys.modules.pop("app.config", None)
+
+
+def test_numeric_parse_warnings_name_the_setting(monkeypatch):
+    from loguru import logger
+
+    import app.config as cfg
+
+    monkeypatch.setitem(cfg._ENV, "STRM_PROXY_TOKEN_TTL_SECONDS", "0")
+    monkeypatch.setitem(cfg._ENV, "STRM_PROXY_CACHE_TTL_SECONDS", "soon")
+    monkeypatch.setitem(cfg._ENV, "SPECIALS_METADATA_TIMEOUT_SECONDS", "abc")
+    messages: list[str] = []
+    sink_id = logger.add(messages.append, level="WARNING", format="{message}")
+    try:
+        assert cfg._as_positive_int("STRM_PROXY_TOKEN_TTL_SECONDS", 900) == 900
+        assert cfg._as_int("STRM_PROXY_CACHE_TTL_SECONDS", 0) == 0
+        assert cfg._as_float("SPECIALS_METADATA_TIMEOUT_SECONDS", 8.0) == 8.0
+    finally:
+        logger.remove(sink_id)
+
+    assert [m.strip() for m in messages] == [
+        "STRM_PROXY_TOKEN_TTL_SECONDS must be positive (got 0); defaulting to 900.",
+        "Invalid STRM_PROXY_CACHE_TTL_SECONDS='soon'; defaulting to 0.",
+        "Invalid SPECIALS_METADATA_TIMEOUT_SECONDS='abc'; defaulting to 8.0.",
+    ]
@@ -65,3 +65,22 @@ def test_cors_off_adds_no_headers() -> None:
 
     assert res.status_code == 405
     assert "access-control-allow-origin" not in res.headers
+
+
+def test_cors_rejects_origin_not_in_explicit_list() -> None:
+    app = _make_app(
+        origins=["http://localhost:5173", "https://anibridge.example"],
+        allow_credentials=True,
+    )
+    client = TestClient(app)
+
+    res = client.options(
+        "/health",
+        headers={
+            "Origin": "https://evil.example",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert res.status_code == 400
+    assert "access-control-allow-origin" not in res.headers
@@ -509,3 +509,103 @@ def test_download_episode_sets_release_override_to_none_when_hint_is_empty(
 
     assert output == tmp_path / "tmp.mp4"
     assert captured["release_name_override"] is None
+
+
+def test_download_episode_retries_remaining_hosts_after_failed_download(
+    stub_aniworld_parser, monkeypatch, tmp_path: Path
+):
+    import importlib
+
+    del stub_aniworld_parser
+    dl = importlib.import_module("app.core.downloader.download")
+
+    probed: list[list[str]] = []
+    attempted: list[str] = []
+
+    monkeypatch.setattr(dl, "PROVIDER_ORDER", ["VOE", "Filemoon", "Streamtape"])
+    monkeypatch.setattr(dl, "build_episode", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        dl,
+        "get_direct_url_with_fallback",
+        lambda _ep, preferred, language: ("https://voe.test/v.m3u8", "VOE"),
+    )
+
+    def _fake_probe(_ep, providers, _language, _tried):
+        probed.append(list(providers))
+        return f"https://{providers[0].lower()}.test/v.m3u8", providers[0]
+
+    def _fake_ydl_download(url, dest_dir, **_kwargs):
+        attempted.append(url)
+        if "streamtape" not in url:
+            raise dl.DownloadError("boom")
+        tmp_file = dest_dir / "tmp.mp4"
+        tmp_file.write_bytes(b"ok")
+        return tmp_file, {}
+
+    monkeypatch.setattr(dl, "_probe_providers", _fake_probe)
+    monkeypatch.setattr(dl, "_ydl_download", _fake_ydl_download)
+    monkeypatch.setattr(dl, "rename_to_release", lambda **kwargs: kwargs["path"])
+
+    output = dl.download_episode(
+        slug="demo",
+        season=1,
+        episode=1,
+        provider="VOE",
+        dest_dir=tmp_path,
+    )
+
+    assert output == tmp_path / "tmp.mp4"
+    assert probed == [["Filemoon", "Streamtape"], ["Streamtape"]]
+    assert attempted == [
+        "https://voe.test/v.m3u8",
+        "https://filemoon.test/v.m3u8",
+        "https://streamtape.test/v.m3u8",
+    ]
+
+
+def test_download_episode_skips_host_fallback_after_cancellation(
+    stub_aniworld_parser, monkeypatch, tmp_path: Path
+):
+    import errno
+    import importlib
+
+    import pytest
+
+    del stub_aniworld_parser
+    dl = importlib.import_module("app.core.downloader.download")
+
+    probed: list[list[str]] = []
+    monkeypatch.setattr(dl, "PROVIDER_ORDER", ["VOE", "Filemoon"])
+    monkeypatch.setattr(dl, "build_episode", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        dl,
+        "get_direct_url_with_fallback",
+        lambda _ep, preferred, language: ("https://voe.test/v.m3u8", "VOE"),
+    )
+    monkeypatch.setattr(
+        dl,
+        "_probe_providers",
+        lambda _ep, providers, _language, _tried: probed.append(list(providers)),
+    )
+
+    failures = iter(
+        [
+            dl.DownloadError("Cancelled"),
+            OSError(errno.ENOSPC, "No space left on device"),
+        ]
+    )
+
+    def _fake_ydl_download(_url, _dest_dir, **_kwargs):
+        try:
+            raise next(failures)
+        except OSError as exc:
+            raise dl.DownloadError("Unexpected error") from exc
+
+    monkeypatch.setattr(dl, "_ydl_download", _fake_ydl_download)
+
+    with pytest.raises(dl.DownloadError, match="Cancelled"):
+        dl.download_episode(slug="demo", season=1, episode=1, dest_dir=tmp_path)
+    with pytest.raises(dl.DownloadError, match="Unexpected error"):
+        dl.download_episode(slug="demo", season=1, episode=1, dest_dir=tmp_path)
+
+    assert probed == []
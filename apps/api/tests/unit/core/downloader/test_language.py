@@ -0,0 +1,43 @@
+def test_normalize_language_maps_aliases_and_defaults():
+    from app.core.downloader.language import normalize_language
+
+    assert normalize_language(None) == "German Dub"
+    assert normalize_language("") == "German Dub"
+    assert normalize_language("Deutsch") == "German Dub"
+    assert normalize_language("ger-sub") == "German Sub"
+    assert normalize_language("Eng Sub") == "English Sub"
+    assert normalize_language("Klingon") == "Klingon"
+
+
+def test_normalize_language_canonicalizes_label_variants():
+    from app.core.downloader.language import normalize_language
+
+    assert normalize_language("German Dub") == "German Dub"
+    assert normalize_language("german dub") == "German Dub"
+    assert normalize_language("English-Dub") == "English Dub"
+
+
+def test_normalize_language_matches_hyphenated_aliases():
+    from app.core.downloader.language import normalize_language
+
+    assert normalize_language("de-sub") == "German Sub"
+    assert normalize_language("EN-Dub") == "English Dub"
+
+
+def test_normalize_language_logs_every_call_despite_memoization():
+    from loguru import logger
+
+    from app.core.downloader.language import normalize_language
+
+    messages: list[str] = []
+    sink_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        normalize_language("gersub")
+        normalize_language("gersub")
+    finally:
+        logger.remove(sink_id)
+
+    assert [m.strip() for m in messages] == [
+        "Normalized language 'gersub' -> 'German Sub'",
+        "Normalized language 'gersub' -> 'German Sub'",
+    ]
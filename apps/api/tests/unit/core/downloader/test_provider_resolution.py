@@ -0,0 +1,172 @@
+import importlib
+import threading
+import time
+
+import pytest
+
+
+class _FakeEpisode:
+    def __init__(self, delays: dict[str, float], urls: dict[str, str]):
+        self.delays = delays
+        self.urls = urls
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_direct_link(self, provider: str, _language: str):
+        with self._lock:
+            self.calls.append(provider)
+        time.sleep(self.delays.get(provider, 0))
+        return self.urls.get(provider)
+
+
+def _load(monkeypatch, order: list[str], concurrency: int):
+    module = importlib.import_module("app.core.downloader.provider_resolution")
+    monkeypatch.setattr(module, "PROVIDER_ORDER", order)
+    monkeypatch.setattr(module, "PROVIDER_PROBE_CONCURRENCY", concurrency)
+    monkeypatch.setattr(module, "_PROBE_HEDGE_DELAY_SECONDS", 0.05)
+    return module
+
+
+def test_fallback_probes_run_concurrently_and_keep_priority(
+    stub_aniworld_parser, monkeypatch
+):
+    del stub_aniworld_parser
+    module = _load(monkeypatch, ["VOE", "Filemoon", "Streamtape", "Vidoza"], 4)
+    ep = _FakeEpisode(
+        delays={"VOE": 0.3, "Filemoon": 0.3, "Streamtape": 0.3, "Vidoza": 0.0},
+        urls={"Streamtape": "https://streamtape/x", "Vidoza": "https://vidoza/x"},
+    )
+
+    started = time.monotonic()
+    url, provider = module.get_direct_url_with_fallback(
+        ep, preferred=None, language="German Dub"
+    )
+    elapsed = time.monotonic() - started
+
+    assert (url, provider) == ("https://streamtape/x", "Streamtape")
+    assert elapsed < 0.8
+    assert set(ep.calls) == {"VOE", "Filemoon", "Streamtape", "Vidoza"}
+
+
+def test_fallback_probing_is_sequential_with_concurrency_one(
+    stub_aniworld_parser, monkeypatch
+):
+    del stub_aniworld_parser
+    module = _load(monkeypatch, ["VOE", "Filemoon", "Streamtape"], 1)
+    ep = _FakeEpisode(delays={}, urls={"Filemoon": "https://filemoon/x"})
+
+    url, provider = module.get_direct_url_with_fallback(
+        ep, preferred="VOE", language="German Dub"
+    )
+
+    assert (url, provider) == ("https://filemoon/x", "Filemoon")
+    assert ep.calls == ["VOE", "Filemoon"]
+
+
+def test_direct_link_lookups_are_cached_per_episode_link(
+    stub_aniworld_parser, monkeypatch
+):
+    del stub_aniworld_parser
+    module = _load(monkeypatch, ["VOE", "Filemoon"], 1)
+    monkeypatch.setattr(module, "_DIRECT_CACHE", module.OrderedDict())
+    ep = _FakeEpisode(delays={}, urls={"Filemoon": "https://filemoon/x"})
+    ep.link = "https://aniworld.to/anime/stream/demo/staffel-1/episode-1"
+
+    for _ in range(2):
+        assert module.get_direct_url_with_fallback(
+            ep, preferred="VOE", language="German Dub"
+        ) == ("https://filemoon/x", "Filemoon")
+
+    assert ep.calls == ["VOE", "Filemoon"]
+
+    monkeypatch.setattr(module, "_DIRECT_CACHE_NEGATIVE_TTL_SECONDS", -1.0)
+    module._DIRECT_CACHE.clear()
+    module.get_direct_url_with_fallback(ep, preferred="VOE", language="German Dub")
+    module.get_direct_url_with_fallback(ep, preferred="VOE", language="German Dub")
+
+    assert ep.calls == ["VOE", "Filemoon", "VOE", "Filemoon", "VOE"]
+
+
+def test_parse_available_languages_from_error(stub_aniworld_parser):
+    del stub_aniworld_parser
+    module = importlib.import_module("app.core.downloader.provider_resolution")
+    parse = module._parse_available_languages_from_error
+
+    assert parse(
+        "No provider found for language. "
+        "available LANGUAGES: ['German Sub', \"English Sub\", 'German Sub', ]"
+    ) == ["German Sub", "English Sub"]
+    assert parse("Available languages: none ['German Sub']") == []
+    assert parse("Available languages: ['German Sub'") == []
+    assert parse("connection reset") == []
+    assert parse(
+        "İİİ Folge nicht gefunden. Available languages: ['German Sub', 'English Dub']"
+    ) == ["German Sub", "English Dub"]
+    assert parse("") == []
+
+
+def test_forget_direct_url_forces_a_fresh_probe(stub_aniworld_parser, monkeypatch):
+    del stub_aniworld_parser
+    module = _load(monkeypatch, ["VOE"], 1)
+    monkeypatch.setattr(module, "_DIRECT_CACHE", module.OrderedDict())
+    ep = _FakeEpisode(delays={}, urls={"VOE": "https://voe/x"})
+    ep.link = "https://s.to/serie/demo/staffel-1/episode-1"
+
+    module.get_direct_url_with_fallback(ep, preferred=None, language="German Dub")
+    module.forget_direct_url(ep, "VOE", "Deutsch")
+    module.get_direct_url_with_fallback(ep, preferred=None, language="German Dub")
+
+    assert ep.calls == ["VOE", "VOE"]
+
+
+def test_language_unavailable_answers_are_cached(stub_aniworld_parser, monkeypatch):
+    del stub_aniworld_parser
+    module = _load(monkeypatch, ["VOE"], 1)
+    monkeypatch.setattr(module, "_DIRECT_CACHE", module.OrderedDict())
+    calls: list[str] = []
+
+    class _NoDubEpisode:
+        link = "https://aniworld.to/anime/stream/demo/staffel-1/episode-2"
+
+        def get_direct_link(self, provider: str, _language: str):
+            calls.append(provider)
+            raise ValueError(
+                "No provider found for language. Available languages: ['German Sub']"
+            )
+
+    for _ in range(2):
+        with pytest.raises(module.LanguageUnavailableError) as excinfo:
+            module.get_direct_url_with_fallback(
+                _NoDubEpisode(), preferred=None, language="German Dub"
+            )
+        assert excinfo.value.available == ["German Sub"]
+
+    assert calls == ["VOE"]
+
+
+def test_winner_returns_promptly_and_no_probes_start_after_it(
+    stub_aniworld_parser, monkeypatch
+):
+    del stub_aniworld_parser
+    module = _load(
+        monkeypatch, ["VOE", "Filemoon", "Streamtape", "Vidoza", "Doodstream"], 2
+    )
+    # Hedging stays out of the way, so only the initial batch is dispatched.
+    monkeypatch.setattr(module, "_PROBE_HEDGE_DELAY_SECONDS", 0.5)
+    ep = _FakeEpisode(
+        delays={"VOE": 0.1, "Filemoon": 1.0, "Streamtape": 1.0, "Vidoza": 1.0},
+        urls={"VOE": "https://voe/x"},
+    )
+
+    started = time.monotonic()
+    assert module.get_direct_url_with_fallback(
+        ep, preferred=None, language="German Dub"
+    ) == ("https://voe/x", "VOE")
+    elapsed = time.monotonic() - started
+    calls_at_return = list(ep.calls)
+
+    # The slow sibling from the initial batch does not hold the call.
+    assert elapsed < 0.6
+    assert sorted(calls_at_return) == ["Filemoon", "VOE"]
+    time.sleep(1.2)
+    assert ep.calls == calls_at_return
@@ -1,5 +1,24 @@
 from pathlib import Path
 
+import pytest
+
+
+class _HeadResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _stub_url_preflight(monkeypatch):
+    """Keep the HEAD pre-flight off the network for option-building tests."""
+    import importlib
+
+    mod = importlib.import_module("app.core.downloader.ytdlp")
+    monkeypatch.setattr(mod.requests, "head", lambda _url, **_kw: _HeadResponse(200))
+
 
 def _make_dummy_ydl(captured: dict[str, object], filename: str):
     """Build a minimal YoutubeDL test double that records options."""
@@ -32,7 +51,7 @@ def test_ydl_download_applies_rate_limit(monkeypatch, tmp_path: Path):
     captured: dict[str, object] = {}
     DummyYDL = _make_dummy_ydl(captured, str(tmp_path / "demo.mp4"))
 
-    monkeypatch.setattr(mod.yt_dlp, "YoutubeDL", DummyYDL)
+    monkeypatch.setattr("yt_dlp.YoutubeDL", DummyYDL)
 
     path, _info = mod._ydl_download("https://example.test/video.mp4", tmp_path)
 
@@ -45,10 +64,11 @@ def test_ydl_download_scales_rate_limit_for_hls_fragments(monkeypatch, tmp_path:
 
     mod = importlib.import_module("app.core.downloader.ytdlp")
     monkeypatch.setattr(mod, "DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC", 5242880)
+    monkeypatch.setattr(mod, "YTDLP_CONCURRENT_FRAGMENTS", 4)
 
     captured: dict[str, object] = {}
     DummyYDL = _make_dummy_ydl(captured, str(tmp_path / "demo.mp4"))
-    monkeypatch.setattr(mod.yt_dlp, "YoutubeDL", DummyYDL)
+    monkeypatch.setattr("yt_dlp.YoutubeDL", DummyYDL)
 
     path, _info = mod._ydl_download("https://example.test/master.m3u8", tmp_path)
 
@@ -66,9 +86,145 @@ def test_ydl_download_omits_rate_limit_when_disabled(monkeypatch, tmp_path: Path
     captured: dict[str, object] = {}
     DummyYDL = _make_dummy_ydl(captured, str(tmp_path / "demo.mp4"))
 
-    monkeypatch.setattr(mod.yt_dlp, "YoutubeDL", DummyYDL)
+    monkeypatch.setattr("yt_dlp.YoutubeDL", DummyYDL)
 
     path, _info = mod._ydl_download("https://example.test/video", tmp_path)
 
     assert path == tmp_path / "demo.mp4"
     assert "ratelimit" not in captured["opts"]
+    assert captured["opts"]["concurrent_fragment_downloads"] == 8
+    assert captured["opts"]["http_chunk_size"] == 10 * 1024 * 1024
+
+
+def test_importing_downloader_does_not_load_yt_dlp():
+    import os
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; "
+                "import app.core.downloader, app.utils.probe_quality; "
+                "print('yt_dlp' in sys.modules)"
+            ),
+        ],
+        cwd=Path(__file__).resolve().parents[4],
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_ydl_progress_hook_coalesces_downloading_updates(monkeypatch, tmp_path: Path):
+    import importlib
+
+    mod = importlib.import_module("app.core.downloader.ytdlp")
+    monkeypatch.setattr(mod, "_PROGRESS_MIN_INTERVAL_SECONDS", 60.0)
+
+    captured: dict[str, object] = {}
+    DummyYDL = _make_dummy_ydl(captured, str(tmp_path / "demo.mp4"))
+    monkeypatch.setattr("yt_dlp.YoutubeDL", DummyYDL)
+
+    seen: list[str] = []
+    mod._ydl_download(
+        "https://example.test/video.mp4",
+        tmp_path,
+        progress_cb=lambda d: seen.append(f"{d['status']}:{d['n']}"),
+    )
+    hook = captured["opts"]["progress_hooks"][0]
+    for n in range(5):
+        hook({"status": "downloading", "n": n})
+    hook({"status": "finished", "n": 5})
+
+    assert seen == ["downloading:0", "finished:5"]
+
+
+def test_ydl_download_uses_aria2c_only_for_progressive_urls(
+    monkeypatch, tmp_path: Path
+):
+    import importlib
+
+    mod = importlib.import_module("app.core.downloader.ytdlp")
+    monkeypatch.setattr(mod, "DOWNLOAD_RATE_LIMIT_BYTES_PER_SEC", 0)
+    monkeypatch.setattr(mod, "_ARIA2C_PATH", "/usr/bin/aria2c")
+
+    captured: dict[str, object] = {}
+    DummyYDL = _make_dummy_ydl(captured, str(tmp_path / "demo.mp4"))
+    monkeypatch.setattr("yt_dlp.YoutubeDL", DummyYDL)
+
+    mod._ydl_download("https://example.test/video.mp4", tmp_path)
+    assert captured["opts"]["external_downloader"] == {
+        "http": "/usr/bin/aria2c",
+        "https": "/usr/bin/aria2c",
+    }
+
+    mod._ydl_download("https://example.test/master.m3u8", tmp_path)
+    assert "external_downloader" not in captured["opts"]
+
+
+def test_ydl_download_fails_fast_on_dead_progressive_url(monkeypatch, tmp_path: Path):
+    import importlib
+
+    mod = importlib.import_module("app.core.downloader.ytdlp")
+    statuses = {
+        "https://example.test/gone.mp4": 404,
+        "https://example.test/no-head.mp4": 405,
+    }
+    heads: list[str] = []
+
+    def _fake_head(url, **_kwargs):
+        heads.append(url)
+        return _HeadResponse(statuses[url])
+
+    monkeypatch.setattr(mod.requests, "head", _fake_head)
+    assert mod._probe_url("https://example.test/no-head.mp4") is None
+
+    captured: dict[str, object] = {}
+    monkeypatch.setattr(
+        "yt_dlp.YoutubeDL", _make_dummy_ydl(captured, str(tmp_path / "x.mp4"))
+    )
+    with pytest.raises(mod.DownloadError, match=r"dead url \(HTTP 404\)"):
+        mod._ydl_download("https://example.test/gone.mp4", tmp_path)
+    assert "opts" not in captured
+
+    mod._ydl_download("https://example.test/master.m3u8", tmp_path)
+    assert "opts" in captured
+    assert heads == [
+        "https://example.test/no-head.mp4",
+        "https://example.test/gone.mp4",
+    ]
+
+
+def test_ydl_download_proceeds_when_head_is_forbidden(monkeypatch, tmp_path: Path):
+    import importlib
+
+    from yt_dlp.utils.networking import std_headers
+
+    mod = importlib.import_module("app.core.downloader.ytdlp")
+    cookiefile = tmp_path / "cookies.txt"
+    cookiefile.write_text(
+        "# Netscape HTTP Cookie File\nexample.test\tFALSE\t/\tFALSE\t0\tsession\tabc\n"
+    )
+    seen: dict[str, object] = {}
+
+    def _fake_head(_url, **kwargs):
+        seen.update(kwargs)
+        return _HeadResponse(403)
+
+    monkeypatch.setattr(mod.requests, "head", _fake_head)
+    captured: dict[str, object] = {}
+    monkeypatch.setattr(
+        "yt_dlp.YoutubeDL", _make_dummy_ydl(captured, str(tmp_path / "x.mp4"))
+    )
+
+    mod._ydl_download("https://example.test/video.mp4", tmp_path, cookiefile=cookiefile)
+
+    assert "opts" in captured
+    assert seen["headers"]["User-Agent"] == std_headers["User-Agent"]
+    assert [cookie.name for cookie in seen["cookies"]] == ["session"]
@@ -44,3 +44,44 @@ def test_bootstrap_captures_loguru_output_in_terminal_log(tmp_path):
     assert len(log_files) == 1
     assert "terminal-log-regression-marker" in log_files[0].read_text()
     assert "terminal-log-regression-marker" in result.stdout
+
+
+def test_config_restores_stdout_sink_after_external_remove(monkeypatch):
+    import io
+
+    logger_module = importlib.import_module("app.utils.logger")
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+
+    try:
+        logger_module.config()
+        logger_module.logger.remove()
+        logger_module.config()
+        logger_module.logger.info("sink-restored-marker")
+    finally:
+        monkeypatch.undo()
+        logger_module.config()
+
+    assert "sink-restored-marker" in stream.getvalue()
+
+
+def test_config_reuses_registered_sink_until_level_or_stdout_changes(monkeypatch):
+    import io
+
+    logger_module = importlib.import_module("app.utils.logger")
+    try:
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        logger_module.config()
+        first = logger_module._STDOUT_SINK_ID
+
+        logger_module.config()
+        assert logger_module._STDOUT_SINK_ID == first
+
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        logger_module.config()
+        assert logger_module._STDOUT_SINK_ID != first
+    finally:
+        monkeypatch.undo()
+        logger_module.config()